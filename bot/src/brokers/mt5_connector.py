@@ -1,8 +1,23 @@
 import MetaTrader5 as mt5
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pytz
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, Optional, List, Tuple
+
+# Map timeframe strings to MT5 constants
+TIMEFRAME_MAP = {
+    "M1": mt5.TIMEFRAME_M1,
+    "M5": mt5.TIMEFRAME_M5,
+    "M15": mt5.TIMEFRAME_M15,
+    "M30": mt5.TIMEFRAME_M30,
+    "H1": mt5.TIMEFRAME_H1,
+    "H4": mt5.TIMEFRAME_H4,
+    "D1": mt5.TIMEFRAME_D1,
+    "W1": mt5.TIMEFRAME_W1,
+    "MN1": mt5.TIMEFRAME_MN1
+}
 
 class MT5Connector:
     """Connector for MetaTrader 5 platform."""
@@ -11,6 +26,7 @@ class MT5Connector:
         """Initialize MT5 connector with configuration."""
         self.config = self._load_config(config_path)
         self.connected = False
+        self._executor = ThreadPoolExecutor(max_workers=self.config.get('data_workers', 8))
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from file."""
@@ -108,6 +124,103 @@ class MT5Connector:
         print(f"Order placed successfully. Order ID: {result.order}")
         return result.order
     
+    def place_pending_order(
+        self,
+        symbol: str,
+        order_type: str,
+        volume: float,
+        price: float,
+        stop_loss: Optional[float] = None,
+        take_profit: Optional[float] = None,
+        expiration: Optional[datetime] = None,
+        comment: str = "MT5 Pending Order"
+    ) -> int:
+        """Place a pending stop or limit order."""
+        if not self.connected:
+            raise ConnectionError("Not connected to MT5")
+        
+        # Map order type string to MT5 constants
+        order_type_map = {
+            "buy_stop": mt5.ORDER_TYPE_BUY_STOP,
+            "sell_stop": mt5.ORDER_TYPE_SELL_STOP,
+            "buy_limit": mt5.ORDER_TYPE_BUY_LIMIT,
+            "sell_limit": mt5.ORDER_TYPE_SELL_LIMIT
+        }
+        
+        if order_type not in order_type_map:
+            raise ValueError(f"Invalid order type: {order_type}. Must be one of {list(order_type_map.keys())}")
+        
+        # Prepare order request
+        request = {
+            "action": mt5.TRADE_ACTION_PENDING,
+            "symbol": symbol,
+            "volume": volume,
+            "type": order_type_map[order_type],
+            "price": price,
+            "magic": 12345,
+            "comment": comment,
+            "type_time": mt5.ORDER_TIME_GTC,
+            "type_filling": mt5.ORDER_FILLING_RETURN,
+        }
+        
+        # Add stop loss, take profit and expiration if provided
+        if stop_loss is not None:
+            request["sl"] = stop_loss
+        if take_profit is not None:
+            request["tp"] = take_profit
+        if expiration is not None:
+            request["type_time"] = mt5.ORDER_TIME_SPECIFIED
+            request["expiration"] = int(expiration.timestamp())
+        
+        # Send order
+        result = mt5.order_send(request)
+        if result.retcode != mt5.TRADE_RETCODE_DONE:
+            raise RuntimeError(f"Pending order failed: {result.retcode}. Comment: {result.comment}")
+        
+        print(f"Pending order placed successfully. Order ID: {result.order}")
+        return result.order
+    
+    def place_pending_orders_batch(self, requests: List[Tuple]) -> List[Optional[int]]:
+        """
+        Place several pending orders at once.
+        
+        Args:
+            requests: place_pending_order arguments for each order, starting with the symbol
+        
+        Returns:
+            List of order IDs in input order, None for orders that failed
+        """
+        return self._run_bulk(self.place_pending_order, requests)
+    
+    def cancel_order(self, ticket: int) -> bool:
+        """Cancel a pending order by its ticket."""
+        if not self.connected:
+            raise ConnectionError("Not connected to MT5")
+        
+        # Prepare remove request
+        request = {
+            "action": mt5.TRADE_ACTION_REMOVE,
+            "order": ticket,
+            "magic": 12345,
+        }
+        
+        # Send remove request
+        result = mt5.order_send(request)
+        if result.retcode != mt5.TRADE_RETCODE_DONE:
+            raise RuntimeError(f"Cancel order failed: {result.retcode}. Comment: {result.comment}")
+        
+        print(f"Order {ticket} cancelled successfully")
+        return True
+    
+    def cancel_orders_batch(self, tickets: List[int]) -> List[Optional[bool]]:
+        """
+        Cancel several pending orders at once.
+        
+        Returns:
+            List of cancel results in input order, None for orders that failed to cancel
+        """
+        return self._run_bulk(self.cancel_order, [(ticket,) for ticket in tickets])
+    
     def get_historical_data(
         self, 
         symbol: str, 
@@ -116,24 +229,32 @@ class MT5Connector:
         to_date: datetime = None
     ) -> pd.DataFrame:
         """Get historical price data."""
+        rates = self.get_rates(symbol, timeframe, from_date, to_date)
+        
+        # Convert to DataFrame
+        df = pd.DataFrame(rates)
+        df['time'] = pd.to_datetime(df['time'], unit='s')
+        return df
+    
+    def get_rates(
+        self,
+        symbol: str,
+        timeframe: str,
+        from_date: datetime,
+        to_date: datetime = None
+    ) -> np.ndarray:
+        """
+        Get historical price data as the terminal's structured array, without building a DataFrame.
+        
+        Returns:
+            Array of bars with fields time (epoch seconds), open, high, low, close,
+            tick_volume, spread and real_volume
+        """
         if not self.connected:
             raise ConnectionError("Not connected to MT5")
         
-        # Map timeframe string to MT5 constants
-        timeframe_map = {
-            "M1": mt5.TIMEFRAME_M1,
-            "M5": mt5.TIMEFRAME_M5,
-            "M15": mt5.TIMEFRAME_M15,
-            "M30": mt5.TIMEFRAME_M30,
-            "H1": mt5.TIMEFRAME_H1,
-            "H4": mt5.TIMEFRAME_H4,
-            "D1": mt5.TIMEFRAME_D1,
-            "W1": mt5.TIMEFRAME_W1,
-            "MN1": mt5.TIMEFRAME_MN1
-        }
-        
-        if timeframe not in timeframe_map:
-            raise ValueError(f"Invalid timeframe: {timeframe}. Must be one of {list(timeframe_map.keys())}")
+        if timeframe not in TIMEFRAME_MAP:
+            raise ValueError(f"Invalid timeframe: {timeframe}. Must be one of {list(TIMEFRAME_MAP.keys())}")
         
         # Set timezone to UTC
         timezone = pytz.timezone("Etc/UTC")
@@ -144,14 +265,45 @@ class MT5Connector:
             to_date = timezone.localize(to_date)
         
         # Get historical data
-        rates = mt5.copy_rates_range(symbol, timeframe_map[timeframe], from_date, to_date)
+        rates = mt5.copy_rates_range(symbol, TIMEFRAME_MAP[timeframe], from_date, to_date)
         if rates is None or len(rates) == 0:
             raise RuntimeError(f"Failed to get historical data: {mt5.last_error()}")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(rates)
-        df['time'] = pd.to_datetime(df['time'], unit='s')
-        return df
+        return rates
+    
+    def get_historical_data_batch(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        bars: int
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Get the latest bars for several symbols at once.
+        
+        The per-symbol requests are issued concurrently, so a batch takes roughly
+        one terminal round-trip instead of one per symbol.
+        
+        Returns:
+            Dict mapping each symbol to its bars, or None if no data was returned
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to MT5")
+        
+        if timeframe not in TIMEFRAME_MAP:
+            raise ValueError(f"Invalid timeframe: {timeframe}. Must be one of {list(TIMEFRAME_MAP.keys())}")
+        
+        mt5_timeframe = TIMEFRAME_MAP[timeframe]
+        
+        def fetch(symbol: str) -> Optional[pd.DataFrame]:
+            rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, bars)
+            if rates is None or len(rates) == 0:
+                return None
+            
+            df = pd.DataFrame(rates)
+            df['time'] = pd.to_datetime(df['time'], unit='s')
+            return df
+        
+        return dict(zip(symbols, self._executor.map(fetch, symbols)))
     
     def get_open_positions(self) -> pd.DataFrame:
         """Get currently open positions."""
@@ -204,6 +356,74 @@ class MT5Connector:
         print(f"Position {position_id} closed successfully")
         return True
     
+    def modify_position(self, position_id: int, stop_loss: float, take_profit: float) -> bool:
+        """Modify the stop loss and take profit of an open position."""
+        if not self.connected:
+            raise ConnectionError("Not connected to MT5")
+        
+        # Get position details
+        position = mt5.positions_get(ticket=position_id)
+        if position is None or len(position) == 0:
+            raise ValueError(f"Position with ID {position_id} not found")
+        
+        # Prepare modify request
+        request = {
+            "action": mt5.TRADE_ACTION_SLTP,
+            "position": position_id,
+            "symbol": position[0].symbol,
+            "sl": stop_loss,
+            "tp": take_profit,
+            "magic": 12345,
+        }
+        
+        # Send modify request
+        result = mt5.order_send(request)
+        if result.retcode != mt5.TRADE_RETCODE_DONE:
+            raise RuntimeError(f"Modify position failed: {result.retcode}. Comment: {result.comment}")
+        
+        print(f"Position {position_id} modified successfully")
+        return True
+    
+    def _run_bulk(self, request_fn: Callable[..., Any], requests: List[Tuple]) -> List[Any]:
+        """
+        Send several trade requests concurrently.
+        
+        Returns:
+            List of request_fn results in request order, None for requests that failed
+        """
+        def attempt(args: Tuple) -> Any:
+            try:
+                return request_fn(*args)
+            except Exception as e:
+                print(f"Request for {args[0]} failed: {e}")
+                return None
+        
+        return list(self._executor.map(attempt, requests))
+    
+    def close_positions_bulk(self, position_ids: List[int]) -> List[Optional[bool]]:
+        """
+        Close several positions at once.
+        
+        Returns:
+            List of close results in input order, None for positions that failed to close
+        """
+        return self._run_bulk(self.close_position, [(position_id,) for position_id in position_ids])
+    
+    def modify_positions_bulk(
+        self,
+        modifications: List[Tuple[int, float, float]]
+    ) -> List[Optional[bool]]:
+        """
+        Modify the stop loss and take profit of several positions at once.
+        
+        Args:
+            modifications: (position ID, stop loss, take profit) for each position
+        
+        Returns:
+            List of modify results in input order, None for positions that failed
+        """
+        return self._run_bulk(self.modify_position, modifications)
+    
     def get_symbols(self) -> List[str]:
         """Get list of available symbols."""
         if not self.connected:
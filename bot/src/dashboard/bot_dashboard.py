@@ -578,7 +578,7 @@ def render_log_viewer(filters):
             logs_df["timestamp"] = logs_df["timestamp"].apply(lambda x: x.strftime("%Y-%m-%d %H:%M:%S"))
             
             # Apply date filter
-            logs_df["date"] = pd.to_datetime(logs_df["timestamp"]).dt.date
+            logs_df["date"] = pd.to_datetime(logs_df["timestamp"], format="%Y-%m-%d %H:%M:%S", cache=True).dt.date
             filtered_logs = logs_df[
                 (logs_df["date"] >= filters["start_date"]) &
                 (logs_df["date"] <= filters["end_date"])
@@ -612,7 +612,7 @@ def render_log_viewer(filters):
             logs_df["timestamp"] = logs_df["timestamp"].apply(lambda x: x.strftime("%Y-%m-%d %H:%M:%S"))
             
             # Apply date filter
-            logs_df["date"] = pd.to_datetime(logs_df["timestamp"]).dt.date
+            logs_df["date"] = pd.to_datetime(logs_df["timestamp"], format="%Y-%m-%d %H:%M:%S", cache=True).dt.date
             filtered_logs = logs_df[
                 (logs_df["date"] >= filters["start_date"]) &
                 (logs_df["date"] <= filters["end_date"])
@@ -653,7 +653,7 @@ def render_log_viewer(filters):
             logs_df["timestamp"] = logs_df["timestamp"].apply(lambda x: x.strftime("%Y-%m-%d %H:%M:%S"))
             
             # Apply date filter
-            logs_df["date"] = pd.to_datetime(logs_df["timestamp"]).dt.date
+            logs_df["date"] = pd.to_datetime(logs_df["timestamp"], format="%Y-%m-%d %H:%M:%S", cache=True).dt.date
             filtered_logs = logs_df[
                 (logs_df["date"] >= filters["start_date"]) &
                 (logs_df["date"] <= filters["end_date"])
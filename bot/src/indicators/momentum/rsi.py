@@ -1,6 +1,49 @@
 import numpy as np
 import pandas as pd
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Tuple
+from numba import njit
+
+@njit(cache=True)
+def _wilder_averages(prices: np.ndarray, period: int):
+    """
+    Calculate Wilder-smoothed average gains and losses for every price.
+    
+    Args:
+        prices: Contiguous float64 array of price values
+        period: RSI period
+        
+    Returns:
+        Tuple of (average gains, average losses), zero until the first full period
+    """
+    n = prices.shape[0]
+    avg_gain = np.zeros(n)
+    avg_loss = np.zeros(n)
+    
+    if n - 1 < period:
+        return avg_gain, avg_loss
+        
+    # First average
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, period + 1):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gain_sum += delta
+        elif delta < 0:
+            loss_sum -= delta
+            
+    avg_gain[period] = gain_sum / period
+    avg_loss[period] = loss_sum / period
+    
+    # Calculate remaining averages using Wilder's smoothing method
+    for i in range(period + 1, n):
+        delta = prices[i] - prices[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain) / period
+        avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss) / period
+        
+    return avg_gain, avg_loss
 
 def calculate_rsi(prices: Union[List[float], np.ndarray], period: int = 14) -> np.ndarray:
     """
@@ -13,33 +56,11 @@ def calculate_rsi(prices: Union[List[float], np.ndarray], period: int = 14) -> n
     Returns:
         Array of RSI values
     """
-    # Convert prices to numpy array if it's not already
-    prices_array = np.array(prices)
-    
-    # Calculate price changes
-    deltas = np.diff(prices_array)
-    
-    # Create arrays of gains and losses
-    gains = np.zeros_like(deltas)
-    losses = np.zeros_like(deltas)
-    
-    # Separate gains and losses
-    gains[deltas > 0] = deltas[deltas > 0]
-    losses[deltas < 0] = -deltas[deltas < 0]
+    # The kernel is compiled for contiguous float64 input only
+    prices_array = np.ascontiguousarray(prices, dtype=np.float64)
     
     # Calculate average gains and losses
-    avg_gain = np.zeros_like(prices_array)
-    avg_loss = np.zeros_like(prices_array)
-    
-    # First average
-    if len(gains) >= period:
-        avg_gain[period] = np.mean(gains[:period])
-        avg_loss[period] = np.mean(losses[:period])
-    
-    # Calculate remaining averages using Wilder's smoothing method
-    for i in range(period + 1, len(prices_array)):
-        avg_gain[i] = (avg_gain[i-1] * (period - 1) + gains[i-1]) / period
-        avg_loss[i] = (avg_loss[i-1] * (period - 1) + losses[i-1]) / period
+    avg_gain, avg_loss = _wilder_averages(prices_array, period)
     
     # Calculate RS (Relative Strength)
     rs = np.zeros_like(prices_array)
@@ -50,6 +71,63 @@ def calculate_rsi(prices: Union[List[float], np.ndarray], period: int = 14) -> n
     
     return rsi
 
+def calculate_wilder_averages(prices: Union[List[float], np.ndarray], period: int = 14) -> Tuple[float, float]:
+    """
+    Calculate the Wilder-smoothed average gain and loss at the last price.
+    
+    These are the averages calculate_rsi uses for its final value, so the RSI can be
+    carried forward one price at a time with update_wilder_averages.
+    
+    Args:
+        prices: Array of price values
+        period: RSI period (default: 14)
+        
+    Returns:
+        Tuple of (average gain, average loss), both 0.0 if there are too few prices
+    """
+    prices_array = np.ascontiguousarray(prices, dtype=np.float64)
+    if len(prices_array) - 1 < period:
+        return 0.0, 0.0
+        
+    avg_gain, avg_loss = _wilder_averages(prices_array, period)
+    return float(avg_gain[-1]), float(avg_loss[-1])
+
+def update_wilder_averages(
+    avg_gain: float,
+    avg_loss: float,
+    delta: float,
+    period: int = 14
+) -> Tuple[float, float]:
+    """
+    Advance Wilder-smoothed average gain and loss by one price change.
+    
+    Args:
+        avg_gain: Current average gain
+        avg_loss: Current average loss
+        delta: Change from the previous price to the new one
+        period: RSI period (default: 14)
+        
+    Returns:
+        Tuple of (average gain, average loss) including the new price
+    """
+    gain = delta if delta > 0 else 0.0
+    loss = -delta if delta < 0 else 0.0
+    return (avg_gain * (period - 1) + gain) / period, (avg_loss * (period - 1) + loss) / period
+
+def rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """
+    Calculate the RSI from average gain and loss, as calculate_rsi does.
+    
+    Args:
+        avg_gain: Average gain
+        avg_loss: Average loss
+        
+    Returns:
+        RSI value
+    """
+    rs = avg_gain / avg_loss if avg_loss > 0 else 0.0
+    return 100.0 - (100.0 / (1.0 + rs))
+
 def add_rsi_to_dataframe(
     df: pd.DataFrame, 
     price_column: str = 'close', 
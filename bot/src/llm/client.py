@@ -0,0 +1,51 @@
+import atexit
+import os
+import threading
+from typing import Optional
+
+import httpx
+import openai
+
+_client: Optional[openai.OpenAI] = None
+_client_lock = threading.Lock()
+
+def get_client(api_key: Optional[str] = None) -> openai.OpenAI:
+    """
+    Get the process-wide OpenAI client.
+
+    The client is created on first use and shared by every LLM component so
+    that all requests reuse the same pooled keep-alive connections instead of
+    paying a TLS handshake per call.
+
+    Args:
+        api_key: API key used when the client is first created (falls back to OPENAI_API_KEY)
+
+    Returns:
+        Shared OpenAI client instance
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = api_key or os.getenv('OPENAI_API_KEY')
+                if not api_key:
+                    raise ValueError("OpenAI API key not found in config or environment variables")
+
+                http_client = httpx.Client(
+                    limits=httpx.Limits(max_connections=64, keepalive_expiry=75)
+                )
+                _client = openai.OpenAI(api_key=api_key, http_client=http_client)
+
+    return _client
+
+def close_client() -> None:
+    """Close the shared OpenAI client and release its connection pool."""
+    global _client
+
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+atexit.register(close_client)
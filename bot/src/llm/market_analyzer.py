@@ -1,10 +1,12 @@
 import os
 import json
 from typing import Dict, Any, List, Optional
-import openai
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+from src.llm.client import get_client
+
 class MarketAnalyzer:
     """
     Uses LLM to analyze market conditions and provide insights.
@@ -22,9 +24,7 @@ class MarketAnalyzer:
     
     def _setup_api(self) -> None:
         """Set up the OpenAI API client."""
-        openai.api_key = self.config.get('openai', {}).get('api_key', os.getenv('OPENAI_API_KEY'))
-        if not openai.api_key:
-            raise ValueError("OpenAI API key not found in config or environment variables")
+        self.client = get_client(self.config.get('openai', {}).get('api_key', os.getenv('OPENAI_API_KEY')))
     
     def analyze_market_data(
         self, 
@@ -70,7 +70,7 @@ class MarketAnalyzer:
         """
         
         # Call the OpenAI API
-        response = openai.ChatCompletion.create(
+        response = self.client.chat.completions.create(
             model=self.config.get('openai', {}).get('model', 'gpt-4'),
             messages=[
                 {"role": "system", "content": "You are an expert forex market analyst with deep knowledge of technical analysis, market patterns, and trading strategies."},
@@ -84,11 +84,12 @@ class MarketAnalyzer:
         analysis_text = response.choices[0].message.content
         
         # Save the analysis
-        analysis_file = self._save_analysis(symbol, analysis_text)
+        now = datetime.now()
+        analysis_file = self._save_analysis(symbol, analysis_text, now)
         
         return {
             "symbol": symbol,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "analysis": analysis_text,
             "data_summary": market_summary,
             "news_summary": news_summary,
@@ -106,15 +107,20 @@ class MarketAnalyzer:
         recent_candles = market_data.tail(10).copy()
         
         # Format candle data
-        candle_summary = "Recent price action:\n"
-        for idx, row in recent_candles.iterrows():
-            candle_summary += f"{idx.strftime('%Y-%m-%d %H:%M')}: O={row['open']:.5f}, H={row['high']:.5f}, L={row['low']:.5f}, C={row['close']:.5f}, V={row['volume']}\n"
+        candle_lines = ["Recent price action:\n"]
+        candle_lines.extend(
+            f"{row.Index.strftime('%Y-%m-%d %H:%M')}: O={row.open:.5f}, H={row.high:.5f}, L={row.low:.5f}, C={row.close:.5f}, V={row.volume}\n"
+            for row in recent_candles.itertuples()
+        )
+        candle_summary = "".join(candle_lines)
         
         # Format technical indicators
-        indicator_summary = "Technical indicators:\n"
-        for indicator_name, indicator_values in technical_indicators.items():
-            recent_values = indicator_values.tail(3)
-            indicator_summary += f"{indicator_name}: {', '.join([f'{val:.5f}' for val in recent_values])}\n"
+        indicator_lines = ["Technical indicators:\n"]
+        indicator_lines.extend(
+            f"{indicator_name}: {', '.join(f'{val:.5f}' for val in indicator_values.tail(3))}\n"
+            for indicator_name, indicator_values in technical_indicators.items()
+        )
+        indicator_summary = "".join(indicator_lines)
         
         # Add current price and daily change
         if not recent_candles.empty:
@@ -142,9 +148,9 @@ class MarketAnalyzer:
         
         return news_summary
     
-    def _save_analysis(self, symbol: str, analysis: str) -> str:
+    def _save_analysis(self, symbol: str, analysis: str, now: Optional[datetime] = None) -> str:
         """Save the market analysis to a file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
         dir_path = f"data/market_analysis/{symbol}"
         filename = f"{dir_path}/{timestamp}_analysis.txt"
         
@@ -186,7 +192,7 @@ class MarketAnalyzer:
         """
         
         # Call the OpenAI API
-        response = openai.ChatCompletion.create(
+        response = self.client.chat.completions.create(
             model=self.config.get('openai', {}).get('model', 'gpt-4'),
             messages=[
                 {"role": "system", "content": "You are an expert in economic news analysis and forex market impact. Your task is to analyze economic news and determine its potential impact on currency markets."},
@@ -223,16 +229,18 @@ class MarketAnalyzer:
             Dictionary with daily market outlook
         """
         # Prepare market summaries
-        market_summaries = []
-        for symbol in symbols:
-            if symbol in market_data:
-                # Get just the recent price and daily change
-                df = market_data[symbol].tail(1)
-                if not df.empty:
-                    current_price = df.iloc[0]['close']
-                    prev_day_price = market_data[symbol].iloc[-2]['close'] if len(market_data[symbol]) > 1 else current_price
-                    daily_change = ((current_price - prev_day_price) / prev_day_price) * 100
-                    market_summaries.append(f"{symbol}: {current_price:.5f} ({daily_change:+.2f}%)")
+        # Pull the last two closes for every symbol as raw arrays and compute all
+        # daily changes in a single vectorized pass
+        available = [s for s in symbols if s in market_data and not market_data[s].empty]
+        closes = [market_data[s]['close'].values for s in available]
+        current_prices = np.fromiter((c[-1] for c in closes), dtype=np.float64, count=len(closes))
+        prev_day_prices = np.fromiter((c[-2] if len(c) > 1 else c[-1] for c in closes), dtype=np.float64, count=len(closes))
+        daily_changes = (current_prices - prev_day_prices) / prev_day_prices * 100.0
+        
+        market_summaries = [
+            f"{symbol}: {current_price:.5f} ({daily_change:+.2f}%)"
+            for symbol, current_price, daily_change in zip(available, current_prices, daily_changes)
+        ]
         
         # Prepare economic calendar summary
         calendar_summary = "Today's economic events:\n"
@@ -262,7 +270,7 @@ class MarketAnalyzer:
         """
         
         # Call the OpenAI API
-        response = openai.ChatCompletion.create(
+        response = self.client.chat.completions.create(
             model=self.config.get('openai', {}).get('model', 'gpt-4'),
             messages=[
                 {"role": "system", "content": "You are an expert forex market analyst providing daily market outlooks and trading recommendations."},
@@ -276,7 +284,8 @@ class MarketAnalyzer:
         outlook_text = response.choices[0].message.content
         
         # Save the outlook
-        timestamp = datetime.now().strftime("%Y%m%d")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d")
         filename = f"data/market_analysis/daily_outlook_{timestamp}.txt"
         
         # Ensure directory exists
@@ -287,7 +296,7 @@ class MarketAnalyzer:
             file.write(outlook_text)
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "symbols": symbols,
             "outlook": outlook_text,
             "outlook_file": filename
@@ -1,10 +1,11 @@
 import os
 import json
 from typing import Dict, Any, List, Optional
-import openai
 from datetime import datetime
 import re
 
+from src.llm.client import get_client
+
 class StrategyGenerator:
     """
     Uses LLM to generate trading strategies from natural language prompts.
@@ -22,9 +23,7 @@ class StrategyGenerator:
     
     def _setup_api(self) -> None:
         """Set up the OpenAI API client."""
-        openai.api_key = self.config.get('openai', {}).get('api_key', os.getenv('OPENAI_API_KEY'))
-        if not openai.api_key:
-            raise ValueError("OpenAI API key not found in config or environment variables")
+        self.client = get_client(self.config.get('openai', {}).get('api_key', os.getenv('OPENAI_API_KEY')))
     
     def generate_strategy(self, prompt: str) -> Dict[str, Any]:
         """
@@ -40,7 +39,7 @@ class StrategyGenerator:
         enhanced_prompt = self._enhance_prompt(prompt)
         
         # Call the OpenAI API
-        response = openai.ChatCompletion.create(
+        response = self.client.chat.completions.create(
             model=self.config.get('openai', {}).get('model', 'gpt-4'),
             messages=[
                 {"role": "system", "content": "You are an expert forex trading strategy developer. Your task is to translate natural language descriptions into detailed, executable trading strategies."},
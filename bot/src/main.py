@@ -9,6 +9,7 @@ import sys
 import json
 import argparse
 from datetime import datetime
+from functools import lru_cache
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
@@ -85,8 +86,9 @@ def run_strategy(strategy_class, args):
     finally:
         logger.info("Strategy runner completed")
 
-def main():
-    """Main function."""
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it on later calls."""
     parser = argparse.ArgumentParser(description="Algorithmic Trading Platform")
     
     # Strategy subcommand
@@ -132,7 +134,12 @@ def main():
     vwap_parser.add_argument("--stop-loss", type=float, default=1.0, help="Stop loss as percentage of VWAP deviation")
     vwap_parser.add_argument("--max-position-size", type=int, default=100, help="Maximum position size in shares")
     
-    args = parser.parse_args()
+    return parser
+
+def main(argv=None):
+    """Main function."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
     
     # Map command to strategy class
     strategy_map = {
@@ -4,15 +4,114 @@ Base strategy class that all other strategies will inherit from.
 Provides common functionality and interfaces for all trading strategies.
 """
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
+import numpy as np
 import pandas as pd
 
+from src.utils.logger import setup_logger
+
+@dataclass(slots=True)
+class StrategyStats:
+    """Running trade statistics for a strategy."""
+    total_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    total_profit: float = 0.0
+    total_loss: float = 0.0
+
+class TradeBuffer:
+    """Columnar (struct-of-arrays) record of executed trades."""
+    
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty trade buffer.
+        
+        Args:
+            capacity: Number of trades to preallocate room for
+        """
+        self._n = 0
+        self._timestamp = np.empty(capacity, dtype="datetime64[ns]")
+        self._action = np.empty(capacity, dtype=object)
+        self._symbol = np.empty(capacity, dtype=object)
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._size = np.empty(capacity, dtype=np.float64)
+        self._profit = np.empty(capacity, dtype=np.float64)
+        
+    def __len__(self) -> int:
+        return self._n
+        
+    def _reserve(self, required: int) -> None:
+        """Grow the columns by doubling until they can hold `required` trades."""
+        capacity = len(self._price)
+        if required <= capacity:
+            return
+            
+        while capacity < required:
+            capacity *= 2
+            
+        for name in ("_timestamp", "_action", "_symbol", "_price", "_size", "_profit"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._n] = column[:self._n]
+            setattr(self, name, grown)
+            
+    def extend(self, timestamp: datetime, trade_results: List[Dict[str, Any]], profits: np.ndarray) -> None:
+        """
+        Append a batch of trade results sharing one timestamp.
+        
+        Args:
+            timestamp: Time the batch was recorded
+            trade_results: Results of executed trades
+            profits: Profit of each trade, already extracted as an array
+        """
+        count = len(trade_results)
+        start, end = self._n, self._n + count
+        self._reserve(end)
+        
+        self._timestamp[start:end] = np.datetime64(timestamp, "ns")
+        self._action[start:end] = [result.get("action", "") for result in trade_results]
+        self._symbol[start:end] = [result.get("symbol", "") for result in trade_results]
+        self._price[start:end] = [result.get("price", 0) for result in trade_results]
+        self._size[start:end] = [result.get("size", 0) for result in trade_results]
+        self._profit[start:end] = profits
+        self._n = end
+        
+    @property
+    def profit(self) -> np.ndarray:
+        """Profit column for the recorded trades."""
+        return self._profit[:self._n]
+        
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Get the recorded trades as a DataFrame.
+        
+        Returns:
+            pd.DataFrame: One row per trade
+        """
+        n = self._n
+        return pd.DataFrame({
+            "timestamp": self._timestamp[:n],
+            "action": self._action[:n],
+            "symbol": self._symbol[:n],
+            "price": self._price[:n],
+            "size": self._size[:n],
+            "profit": self._profit[:n]
+        })
+
 class BaseStrategy(ABC):
     """Base class for all trading strategies."""
     
+    __slots__ = (
+        "config", "logger", "symbol", "timeframe", "is_running", "last_run_time",
+        "_iter_errors", "trades", "stats", "order_batch_size", "order_batch_gap", "_order_pool"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the base strategy.
@@ -21,18 +120,19 @@ class BaseStrategy(ABC):
             config: Strategy configuration dictionary
         """
         self.config = config
+        self.logger = setup_logger(f"{self.__class__.__name__}", f"logs/strategies/{self.__class__.__name__}.log")
         self.symbol = config.get("symbol", "")
         self.timeframe = config.get("timeframe", "")
         self.is_running = False
         self.last_run_time = None
-        self.trades = []
-        self.stats = {
-            "total_trades": 0,
-            "winning_trades": 0,
-            "losing_trades": 0,
-            "total_profit": 0.0,
-            "total_loss": 0.0
-        }
+        self._iter_errors = 0  # Failed iterations, for monitoring
+        self.trades = TradeBuffer()
+        self.stats = StrategyStats()
+        
+        # Order dispatch
+        self.order_batch_size = config.get("order_batch_size", 10)
+        self.order_batch_gap = config.get("order_batch_gap", 1.0)  # Seconds between batches
+        self._order_pool = ThreadPoolExecutor(max_workers=config.get("order_concurrency", 10))
     
     @abstractmethod
     def initialize(self) -> bool:
@@ -100,6 +200,35 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def _dispatch_orders(
+        self,
+        signals: List[Dict[str, Any]],
+        submit_fn: Callable[[Dict[str, Any]], Any]
+    ) -> List[Any]:
+        """
+        Submit orders concurrently in rate-limited batches.
+        
+        Signals are split into batches of `order_batch_size` that are sent in parallel
+        on the order thread pool, pausing `order_batch_gap` seconds between batches.
+        
+        Args:
+            signals: Signals to submit
+            submit_fn: Function that places the order for a single signal
+            
+        Returns:
+            List: Return values of submit_fn, in signal order
+        """
+        results = []
+        
+        for start in range(0, len(signals), self.order_batch_size):
+            if start > 0 and self.order_batch_gap > 0:
+                time.sleep(self.order_batch_gap)
+                
+            batch = signals[start:start + self.order_batch_size]
+            results.extend(self._order_pool.map(submit_fn, batch))
+            
+        return results
+    
     def update_stats(self, trade_results: List[Dict[str, Any]]) -> None:
         """
         Update strategy statistics based on trade results.
@@ -107,63 +236,111 @@ class BaseStrategy(ABC):
         Args:
             trade_results: Results of executed trades
         """
-        for result in trade_results:
-            self.stats["total_trades"] += 1
+        if not trade_results:
+            return
             
-            if result.get("profit", 0) > 0:
-                self.stats["winning_trades"] += 1
-                self.stats["total_profit"] += result.get("profit", 0)
-            else:
-                self.stats["losing_trades"] += 1
-                self.stats["total_loss"] += abs(result.get("profit", 0))
-                
-            self.trades.append({
-                "timestamp": datetime.now(),
-                "action": result.get("action", ""),
-                "symbol": result.get("symbol", ""),
-                "price": result.get("price", 0),
-                "size": result.get("size", 0),
-                "profit": result.get("profit", 0)
-            })
+        # Aggregate the whole batch with array reductions
+        profits = np.fromiter(
+            (result.get("profit", 0) for result in trade_results),
+            dtype=np.float64,
+            count=len(trade_results)
+        )
+        winners = profits > 0
+        
+        stats = self.stats
+        stats.total_trades += len(profits)
+        stats.winning_trades += int(winners.sum())
+        stats.losing_trades += int((~winners).sum())
+        stats.total_profit += float(profits[winners].sum())
+        stats.total_loss += float(np.abs(profits[~winners]).sum())
+        
+        self.trades.extend(datetime.now(), trade_results, profits)
+    
+    def _should_skip_cycle(self) -> Optional[str]:
+        """
+        Cheap pre-check run before each cycle to avoid analysis work when the
+        strategy has nothing to do.
+        
+        Returns:
+            Optional[str]: Reason for skipping the cycle, or None to run it
+        """
+        return None
     
     def run(self, iterations: Optional[int] = None) -> None:
         """
         Run the strategy for a specified number of iterations or indefinitely.
         
+        Args:
+            iterations: Number of iterations to run, or None for indefinite running
+        """
+        asyncio.run(self.run_async(iterations))
+        
+    async def run_async(self, iterations: Optional[int] = None) -> None:
+        """
+        Run the strategy on an asyncio event loop.
+        
+        Order execution and position management both wait on the broker and do not
+        depend on each other, so they are dispatched to worker threads concurrently.
+        
         Args:
             iterations: Number of iterations to run, or None for indefinite running
         """
         self.is_running = True
         iteration_count = 0
+        consecutive_errors = 0
+        loop = asyncio.get_running_loop()
         
         if not self.initialize():
             self.is_running = False
             return
         
+        # Cycles start on a fixed schedule regardless of how long each one takes
+        next_deadline = time.monotonic()
+        
         try:
             while self.is_running:
                 self.last_run_time = datetime.now()
                 
-                # Strategy execution flow
-                analysis = self.analyze_market()
-                signals = self.generate_signals()
-                risk_adjusted_signals = self.manage_risk(signals)
-                execution_results = self.execute_signals(risk_adjusted_signals)
-                position_management_results = self.manage_positions()
-                
-                # Update strategy statistics
-                self.update_stats(execution_results)
+                try:
+                    # Skip the whole cycle when the strategy cannot act
+                    if self._should_skip_cycle() is None:
+                        # Strategy execution flow
+                        analysis = self.analyze_market()
+                        signals = self.generate_signals()
+                        risk_adjusted_signals = self.manage_risk(signals)
+                        execution_results, position_management_results = await asyncio.gather(
+                            loop.run_in_executor(None, self.execute_signals, risk_adjusted_signals),
+                            loop.run_in_executor(None, self.manage_positions)
+                        )
+                        
+                        # Update strategy statistics
+                        self.update_stats(execution_results)
+                        
+                    consecutive_errors = 0
+                except Exception:
+                    # A failed iteration should not stop the strategy
+                    self._iter_errors += 1
+                    consecutive_errors += 1
+                    self.logger.exception("Strategy iteration failed")
                 
                 # Check if we've reached the maximum iterations
                 iteration_count += 1
                 if iterations is not None and iteration_count >= iterations:
                     break
                     
-                # Throttle execution rate
-                time.sleep(self.config.get("execution_interval", 1))
+                # Throttle execution rate, backing off exponentially after failures
+                interval = self.config.get("execution_interval", 1)
+                if consecutive_errors:
+                    interval = min(interval * 2 ** consecutive_errors, interval * 16)
+                    
+                next_deadline += interval
+                sleep_for = next_deadline - time.monotonic()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+                else:
+                    # Overran the schedule; start the next period from now
+                    next_deadline = time.monotonic()
                 
-        except Exception as e:
-            print(f"Error running strategy: {str(e)}")
         finally:
             self.is_running = False
             
@@ -178,13 +355,14 @@ class BaseStrategy(ABC):
         Returns:
             Dict: Strategy statistics
         """
+        stats = self.stats
         win_rate = 0
-        if self.stats["total_trades"] > 0:
-            win_rate = self.stats["winning_trades"] / self.stats["total_trades"] * 100
+        if stats.total_trades > 0:
+            win_rate = stats.winning_trades / stats.total_trades * 100
             
         return {
-            **self.stats,
+            **asdict(stats),
             "win_rate": win_rate,
-            "net_profit": self.stats["total_profit"] - self.stats["total_loss"],
+            "net_profit": stats.total_profit - stats.total_loss,
             "last_run_time": self.last_run_time
         } 
\ No newline at end of file
@@ -4,18 +4,87 @@ Base class for day trading strategies.
 These strategies focus on intraday price movements and typically close all positions by the end of the trading day.
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime, time, timedelta
-import pytz
+from collections import deque
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from datetime import datetime, time, timedelta, timezone
+from time import monotonic, time as epoch_time
+from types import MappingProxyType
+from zoneinfo import ZoneInfo
 import numpy as np
 import pandas as pd
+from numba import njit
 
 from src.strategies.base_strategy import BaseStrategy
-from src.utils.logger import setup_logger
+
+# Initial day_stats for each trading day; copied rather than rebuilt on every reset
+_DAY_STATS_TEMPLATE = MappingProxyType({
+    "date": "",
+    "trades": 0,
+    "wins": 0,
+    "losses": 0,
+    "profit": 0.0,
+    "loss": 0.0,
+    "max_drawdown": 0.0,
+    "start_time": None,
+    "end_time": None,
+    "closed_positions": None
+})
+
+@njit(cache=True)
+def _allocate_capital(prices: np.ndarray, sizes: np.ndarray, remaining_capital: float):
+    """
+    Reserve capital for each signal in order, shrinking sizes that exceed what is left.
+    
+    Args:
+        prices: Entry price of each signal
+        sizes: Requested size of each signal
+        remaining_capital: Capital available before the first signal
+        
+    Returns:
+        Tuple of (adjusted sizes, accepted mask, capital remaining afterwards)
+    """
+    n = prices.shape[0]
+    adjusted_sizes = sizes.copy()
+    accepted = np.zeros(n, dtype=np.bool_)
+    
+    for i in range(n):
+        price = prices[i]
+        size = sizes[i]
+        
+        if price <= 0 or size <= 0:
+            continue
+            
+        position_value = price * size
+        
+        # Shrink the position to whole units that fit the remaining capital
+        if position_value > remaining_capital:
+            size = float(int(remaining_capital / price))
+            if size <= 0:
+                continue
+                
+            adjusted_sizes[i] = size
+            position_value = price * size
+            
+        remaining_capital -= position_value
+        accepted[i] = True
+        
+    return adjusted_sizes, accepted, remaining_capital
 
 class DayStrategyBase(BaseStrategy):
     """Base class for day trading strategies."""
     
+    __slots__ = (
+        "max_daily_trades", "max_daily_drawdown", "profit_target", "trading_hours",
+        "market_open", "market_close", "market_timezone",
+        "_today_date", "_market_open_dt", "_market_close_dt", "_is_trading_day",
+        "_day_start_epoch", "_day_end_epoch", "_market_open_epoch", "_market_close_epoch",
+        "_next_market_open_epoch",
+        "current_day", "day_stats", "daily_trades", "_daily_trade_count", "daily_pnl",
+        "max_daily_capital", "remaining_daily_capital", "_inv_max_daily_capital", "_daily_pnl_pct",
+        "open_positions", "_open_position_count", "_halted_reason", "_no_new_positions_until_close",
+        "gating_ttl", "_market_state"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the day trading strategy.
@@ -24,7 +93,6 @@ class DayStrategyBase(BaseStrategy):
             config: Strategy configuration dictionary
         """
         super().__init__(config)
-        self.logger = setup_logger(f"{self.__class__.__name__}", f"logs/strategies/{self.__class__.__name__}.log")
         
         # Day trading specific configuration
         self.max_daily_trades = config.get("max_daily_trades", 5)
@@ -39,16 +107,42 @@ class DayStrategyBase(BaseStrategy):
         # Convert trading hours to time objects
         self.market_open = datetime.strptime(self.trading_hours["start"], "%H:%M").time()
         self.market_close = datetime.strptime(self.trading_hours["end"], "%H:%M").time()
-        self.market_timezone = pytz.timezone(self.trading_hours["timezone"])
+        self.market_timezone = ZoneInfo(self.trading_hours["timezone"])
+        
+        # Market open/close instants for the cached market date
+        self._today_date = None
+        self._market_open_dt = None
+        self._market_close_dt = None
+        self._is_trading_day = False
+        self._day_start_epoch = 0.0
+        self._day_end_epoch = 0.0
+        self._market_open_epoch = 0.0
+        self._market_close_epoch = 0.0
+        self._next_market_open_epoch = 0.0
         
         # Day tracking
         self.current_day = None
         self.day_stats = {}
-        self.daily_trades = []
+        # Only the count matters for the trade limit, so keep at most max_daily_trades + 1
+        self.daily_trades = deque(maxlen=self.max_daily_trades + 1)
+        self._daily_trade_count = 0
         self.daily_pnl = 0.0
         self.max_daily_capital = config.get("max_daily_capital", 100000.0)
         self.remaining_daily_capital = self.max_daily_capital
+        
+        # Daily P&L as a percentage of capital, kept in step with daily_pnl
+        self._inv_max_daily_capital = 1.0 / self.max_daily_capital if self.max_daily_capital > 0 else 0.0
+        self._daily_pnl_pct = 0.0
         self.open_positions = []
+        self._open_position_count = 0  # Kept in step with open_positions by update_stats and _forget_positions
+        
+        # Set once new signals stop for the rest of the day, so the stop is logged only once
+        self._halted_reason = None
+        self._no_new_positions_until_close = False
+        
+        # Market state from the last analyze_market call, reused for gating_ttl seconds
+        self.gating_ttl = config.get("gating_ttl", 1.0)
+        self._market_state = None  # (monotonic time, is open, minutes to close)
         
     def initialize(self) -> bool:
         """
@@ -59,28 +153,86 @@ class DayStrategyBase(BaseStrategy):
         """
         self.logger.info(f"Initializing day trading strategy: {self.__class__.__name__}")
         self._reset_daily_stats()
+        
+        # Compile the capital allocation kernel now rather than on the first signal
+        _allocate_capital(np.ones(1), np.ones(1), 1.0)
         return True
         
     def _reset_daily_stats(self) -> None:
         """Reset daily statistics at the start of a new trading day."""
         today = datetime.now().strftime("%Y-%m-%d")
         
-        self.daily_trades = []
+        self.daily_trades.clear()
+        self._daily_trade_count = 0
         self.daily_pnl = 0.0
+        self._daily_pnl_pct = 0.0
         self.remaining_daily_capital = self.max_daily_capital
+        self._halted_reason = None
+        self._no_new_positions_until_close = False
+        self._update_market_hours(datetime.now(self.market_timezone).date())
         
-        self.day_stats = {
-            "date": today,
-            "trades": 0,
-            "wins": 0,
-            "losses": 0,
-            "profit": 0.0,
-            "loss": 0.0,
-            "max_drawdown": 0.0,
-            "start_time": None,
-            "end_time": None,
-            "closed_positions": []
-        }
+        day_stats = dict(_DAY_STATS_TEMPLATE)
+        day_stats["date"] = today
+        day_stats["closed_positions"] = []
+        self.day_stats = day_stats
+        
+    def _market_datetime(self, market_date, market_clock: time) -> datetime:
+        """
+        Combine a date and wall-clock time in the market timezone into a UTC datetime.
+        
+        Converting to UTC keeps arithmetic against market-local datetimes exact across
+        DST changes, since datetimes sharing a zoneinfo tzinfo subtract as wall-clock times.
+        
+        Args:
+            market_date: Date in the market timezone
+            market_clock: Wall-clock time in the market timezone
+            
+        Returns:
+            datetime: The corresponding UTC datetime
+        """
+        return datetime.combine(market_date, market_clock, tzinfo=self.market_timezone).astimezone(timezone.utc)
+        
+    def _update_market_hours(self, market_date) -> None:
+        """
+        Cache the market open and close datetimes for a market date.
+        
+        Args:
+            market_date: Date in the market timezone
+        """
+        self._today_date = market_date
+        self._market_open_dt = self._market_datetime(market_date, self.market_open)
+        self._market_close_dt = self._market_datetime(market_date, self.market_close)
+        
+        # Epoch bounds let the hot-path checks compare plain floats
+        self._is_trading_day = market_date.weekday() < 5
+        self._day_start_epoch = self._market_datetime(market_date, time(0, 0)).timestamp()
+        self._day_end_epoch = self._market_datetime(market_date + timedelta(days=1), time(0, 0)).timestamp()
+        self._market_open_epoch = self._market_open_dt.timestamp()
+        self._market_close_epoch = self._market_close_dt.timestamp()
+        
+        # Next open after this date's session (skipping the weekend)
+        next_day = market_date + timedelta(days=1)
+        while next_day.weekday() >= 5:
+            next_day += timedelta(days=1)
+        self._next_market_open_epoch = self._market_datetime(next_day, self.market_open).timestamp()
+        
+    def _current_epoch(self, current_time: Optional[datetime] = None) -> float:
+        """
+        Get the UNIX timestamp for a time, refreshing the cached market hours if it
+        falls outside the cached market date.
+        
+        Args:
+            current_time: Current time (defaults to now)
+            
+        Returns:
+            float: UNIX timestamp in seconds
+        """
+        now = epoch_time() if current_time is None else current_time.timestamp()
+        
+        if not self._day_start_epoch <= now < self._day_end_epoch:
+            self._update_market_hours(datetime.fromtimestamp(now, self.market_timezone).date())
+            
+        return now
         
     def is_market_open(self, current_time: Optional[datetime] = None) -> bool:
         """
@@ -92,19 +244,10 @@ class DayStrategyBase(BaseStrategy):
         Returns:
             bool: True if the market is open, False otherwise
         """
-        if current_time is None:
-            current_time = datetime.now(pytz.UTC)
-            
-        # Convert to market timezone
-        market_time = current_time.astimezone(self.market_timezone)
+        now = self._current_epoch(current_time)
         
-        # Check if it's a weekday (0 = Monday, 6 = Sunday)
-        if market_time.weekday() >= 5:  # Saturday or Sunday
-            return False
-            
-        # Check if within trading hours
-        current_market_time = market_time.time()
-        return self.market_open <= current_market_time < self.market_close
+        # Must be a weekday and within trading hours
+        return self._is_trading_day and self._market_open_epoch <= now < self._market_close_epoch
         
     def time_to_market_open(self, current_time: Optional[datetime] = None) -> float:
         """
@@ -116,53 +259,19 @@ class DayStrategyBase(BaseStrategy):
         Returns:
             float: Minutes until market open, 0 if market is open, -1 if market is closed for the day
         """
-        if current_time is None:
-            current_time = datetime.now(pytz.UTC)
-            
-        # Convert to market timezone
-        market_time = current_time.astimezone(self.market_timezone)
+        now = self._current_epoch(current_time)
         
-        # Check if it's a weekday
-        if market_time.weekday() >= 5:  # Saturday or Sunday
-            # Calculate days until Monday
-            days_to_monday = (7 - market_time.weekday()) % 7
-            if days_to_monday == 0:
-                days_to_monday = 1
+        if self._is_trading_day:
+            # If before market open today
+            if now < self._market_open_epoch:
+                return (self._market_open_epoch - now) / 60
                 
-            # Return minutes until Monday market open
-            next_market_open = datetime.combine(
-                (market_time + timedelta(days=days_to_monday)).date(),
-                self.market_open
-            )
-            next_market_open = self.market_timezone.localize(next_market_open)
-            
-            return (next_market_open - market_time).total_seconds() / 60
-            
-        # If today is a weekday
-        current_market_time = market_time.time()
-        
-        # If before market open today
-        if current_market_time < self.market_open:
-            next_market_open = datetime.combine(market_time.date(), self.market_open)
-            next_market_open = self.market_timezone.localize(next_market_open)
-            return (next_market_open - market_time).total_seconds() / 60
-            
-        # If after market close today
-        if current_market_time >= self.market_close:
-            # Calculate time until tomorrow's market open
-            next_day = market_time.date() + timedelta(days=1)
-            
-            # If tomorrow is a weekend, calculate days until Monday
-            if next_day.weekday() >= 5:
-                days_to_monday = (7 - next_day.weekday()) % 7
-                next_day = next_day + timedelta(days=days_to_monday)
+            # If market is open
+            if now < self._market_close_epoch:
+                return 0
                 
-            next_market_open = datetime.combine(next_day, self.market_open)
-            next_market_open = self.market_timezone.localize(next_market_open)
-            return (next_market_open - market_time).total_seconds() / 60
-            
-        # If market is open
-        return 0
+        # Weekend or after market close: minutes until the next weekday open
+        return (self._next_market_open_epoch - now) / 60
         
     def time_to_market_close(self, current_time: Optional[datetime] = None) -> float:
         """
@@ -174,22 +283,112 @@ class DayStrategyBase(BaseStrategy):
         Returns:
             float: Minutes until market close, -1 if market is closed
         """
-        if current_time is None:
-            current_time = datetime.now(pytz.UTC)
-            
-        # Convert to market timezone
-        market_time = current_time.astimezone(self.market_timezone)
-        current_market_time = market_time.time()
+        now = self._current_epoch(current_time)
         
         # If not a weekday or outside trading hours, market is closed
-        if market_time.weekday() >= 5 or current_market_time < self.market_open or current_market_time >= self.market_close:
+        if not self._is_trading_day or not self._market_open_epoch <= now < self._market_close_epoch:
             return -1
             
         # Calculate time until market close
-        market_close_today = datetime.combine(market_time.date(), self.market_close)
-        market_close_today = self.market_timezone.localize(market_close_today)
+        return (self._market_close_epoch - now) / 60
+        
+    @staticmethod
+    def vectorized_market_state(
+        ts_index: pd.DatetimeIndex,
+        tz: Any,
+        market_open_t: time,
+        market_close_t: time
+    ) -> pd.DataFrame:
+        """
+        Compute the market state for a whole series of timestamps at once.
+        
+        Gives the same values as is_market_open, time_to_market_open and
+        time_to_market_close for every timestamp, so a backtest can precompute them
+        once instead of calling the scalar methods on every iteration.
+        
+        Args:
+            ts_index: Timestamps to evaluate (naive timestamps are taken as UTC)
+            tz: Market timezone
+            market_open_t: Market open time in the market timezone
+            market_close_t: Market close time in the market timezone
+            
+        Returns:
+            pd.DataFrame: Columns is_open, mins_to_open and mins_to_close indexed by ts_index
+        """
+        utc_index = ts_index.tz_localize("UTC") if ts_index.tz is None else ts_index
+        
+        # Market-local calendar days as naive wall-clock midnights
+        local_index = utc_index.tz_convert(tz)
+        day = local_index.tz_localize(None).normalize()
+        weekday = local_index.weekday.to_numpy()
+        
+        epoch = pd.Timestamp(0, tz="UTC")
+        
+        def to_minutes(index: pd.DatetimeIndex) -> np.ndarray:
+            # Minutes since the UNIX epoch, independent of the index resolution
+            return ((index - epoch) / pd.Timedelta(minutes=1)).to_numpy(dtype=np.float64)
+            
+        def session_minutes(days: pd.DatetimeIndex, clock: time) -> np.ndarray:
+            # Localize wall-clock times so open/close instants are exact across DST
+            wall = days + pd.Timedelta(hours=clock.hour, minutes=clock.minute, seconds=clock.second)
+            return to_minutes(wall.tz_localize(tz, ambiguous=True, nonexistent="shift_forward"))
+            
+        open_minutes = session_minutes(day, market_open_t)
+        close_minutes = session_minutes(day, market_close_t)
+        
+        # Next weekday after each day (Friday and Saturday roll to Monday)
+        days_ahead = np.select([weekday == 4, weekday == 5], [3, 2], default=1)
+        next_open_minutes = session_minutes(day + pd.to_timedelta(days_ahead, unit="D"), market_open_t)
+        
+        now = to_minutes(utc_index)
+        is_trading_day = weekday < 5
+        before_open = is_trading_day & (now < open_minutes)
+        is_open = is_trading_day & (open_minutes <= now) & (now < close_minutes)
+        
+        mins_to_open = np.where(
+            before_open,
+            open_minutes - now,
+            np.where(is_open, 0.0, next_open_minutes - now)
+        )
+        mins_to_close = np.where(is_open, close_minutes - now, -1.0)
+        
+        return pd.DataFrame({
+            "is_open": is_open,
+            "mins_to_open": mins_to_open,
+            "mins_to_close": mins_to_close
+        }, index=ts_index)
+        
+    def _should_skip_cycle(self) -> Optional[str]:
+        """
+        Skip the cycle when no day trading work can happen.
+        
+        Cycles still run while positions are open or while the day's open/close
+        bookkeeping in analyze_market is pending.
         
-        return (market_close_today - market_time).total_seconds() / 60
+        Returns:
+            Optional[str]: Reason for skipping the cycle, or None to run it
+        """
+        if self._open_position_count:
+            return None
+            
+        if not self.is_market_open():
+            # A new market date or an unrecorded market close still needs analyze_market
+            if self.current_day != self._today_date.isoformat():
+                return None
+            if self.day_stats["start_time"] is not None and self.day_stats["end_time"] is None:
+                return None
+            return "market closed"
+            
+        if self._daily_trade_count >= self.max_daily_trades:
+            return "max daily trades reached"
+            
+        if self._daily_pnl_pct <= -self.max_daily_drawdown:
+            return "max daily drawdown reached"
+            
+        if self._daily_pnl_pct >= self.profit_target:
+            return "daily profit target reached"
+            
+        return None
         
     def analyze_market(self) -> Dict[str, Any]:
         """
@@ -198,8 +397,7 @@ class DayStrategyBase(BaseStrategy):
         Returns:
             Dict: Analysis results
         """
-        current_time = datetime.now(pytz.UTC)
-        market_time = current_time.astimezone(self.market_timezone)
+        market_time = datetime.now(self.market_timezone)
         today = market_time.strftime("%Y-%m-%d")
         
         # Check if it's a new trading day
@@ -208,13 +406,14 @@ class DayStrategyBase(BaseStrategy):
             self._reset_daily_stats()
             self.current_day = today
             
-            if self.is_market_open(current_time):
+            if self.is_market_open(market_time):
                 self.day_stats["start_time"] = market_time
         
         # Check market status
-        is_open = self.is_market_open(current_time)
-        time_to_open = self.time_to_market_open(current_time)
-        time_to_close = self.time_to_market_close(current_time)
+        is_open = self.is_market_open(market_time)
+        time_to_open = self.time_to_market_open(market_time)
+        time_to_close = self.time_to_market_close(market_time)
+        self._market_state = (monotonic(), is_open, time_to_close)
         
         # Update end time if market is closing
         if not is_open and self.day_stats["start_time"] is not None and self.day_stats["end_time"] is None:
@@ -222,9 +421,9 @@ class DayStrategyBase(BaseStrategy):
             self.logger.info(f"Market closed for the day. Daily P&L: {self.daily_pnl:.2f}")
             
             # Close any remaining positions
-            if self.open_positions:
-                self.logger.info(f"Closing {len(self.open_positions)} remaining positions at market close")
-                self._close_all_positions()
+            if self._open_position_count:
+                self.logger.info(f"Closing {self._open_position_count} remaining positions at market close")
+                self._forget_closed_positions(self._close_all_positions())
         
         # Return analysis results
         return {
@@ -233,14 +432,34 @@ class DayStrategyBase(BaseStrategy):
             "is_open": is_open,
             "time_to_open": time_to_open,
             "time_to_close": time_to_close,
-            "daily_trades": len(self.daily_trades),
+            "daily_trades": self.day_stats["trades"],
             "max_daily_trades": self.max_daily_trades,
             "daily_pnl": self.daily_pnl,
-            "daily_pnl_percentage": (self.daily_pnl / self.max_daily_capital) * 100 if self.max_daily_capital > 0 else 0,
+            "daily_pnl_percentage": self._daily_pnl_pct,
             "remaining_daily_capital": self.remaining_daily_capital,
-            "open_positions": len(self.open_positions)
+            "open_positions": self._open_position_count
         }
         
+    def _current_market_state(self) -> Tuple[bool, float]:
+        """
+        Get whether the market is open and the minutes left until it closes.
+        
+        Reuses the state computed by analyze_market while it is younger than
+        gating_ttl seconds, instead of recomputing it later in the same cycle.
+        
+        Returns:
+            Tuple[bool, float]: Market open flag and minutes to close (-1 if closed)
+        """
+        state = self._market_state
+        if state is not None:
+            age = monotonic() - state[0]
+            if age < self.gating_ttl:
+                is_open, time_to_close = state[1], state[2]
+                return is_open, time_to_close - age / 60 if is_open else time_to_close
+                
+        current_time = datetime.now(timezone.utc)
+        return self.is_market_open(current_time), self.time_to_market_close(current_time)
+        
     def _close_all_positions(self) -> List[Dict[str, Any]]:
         """
         Close all open positions.
@@ -251,38 +470,80 @@ class DayStrategyBase(BaseStrategy):
         # This should be implemented by subclasses
         return []
         
-    def generate_signals(self) -> List[Dict[str, Any]]:
+    def _forget_positions(self, tickets: Iterable[int]) -> None:
         """
-        Generate trading signals for day trading.
+        Drop positions that are no longer open from open_positions.
         
-        Returns:
-            List[Dict]: List of signal dictionaries
+        Args:
+            tickets: Tickets of the positions that were closed
+        """
+        tickets = set(tickets)
+        if not tickets:
+            return
+            
+        self.open_positions = [position for position in self.open_positions if position.get("ticket") not in tickets]
+        self._open_position_count = len(self.open_positions)
+        
+    def _forget_closed_positions(self, results: List[Dict[str, Any]]) -> None:
         """
-        current_time = datetime.now(pytz.UTC)
+        Drop the positions closed by a batch of position management results.
         
-        # Only generate signals if market is open and we haven't reached max trades
-        if not self.is_market_open(current_time) or len(self.daily_trades) >= self.max_daily_trades:
-            return []
+        Args:
+            results: Results of position management actions
+        """
+        self._forget_positions(result.get("ticket") for result in results if result.get("type") == "close_position")
+        
+    def _can_open_positions(self) -> bool:
+        """
+        Check the day trading constraints on opening new positions.
+        
+        Returns:
+            bool: True if new signals may be generated, False otherwise
+        """
+        # Already stopped for the day
+        if self._halted_reason or self._no_new_positions_until_close:
+            return False
+            
+        # Only generate signals if we haven't reached max trades and the market is open
+        if self._daily_trade_count >= self.max_daily_trades:
+            return False
+            
+        is_open, time_to_close = self._current_market_state()
+        if not is_open:
+            return False
             
         # Check if we've hit our profit target or max drawdown
-        daily_pnl_percentage = (self.daily_pnl / self.max_daily_capital) * 100 if self.max_daily_capital > 0 else 0
+        daily_pnl_percentage = self._daily_pnl_pct
         
         if daily_pnl_percentage <= -self.max_daily_drawdown:
+            self._halted_reason = "drawdown"
             self.logger.info(f"Reached max daily drawdown: {daily_pnl_percentage:.2f}%. Stopping for the day.")
-            return []
+            return False
             
         if daily_pnl_percentage >= self.profit_target:
+            self._halted_reason = "profit_target"
             self.logger.info(f"Reached daily profit target: {daily_pnl_percentage:.2f}%. Stopping for the day.")
-            return []
+            return False
             
-        # Time to market close in minutes
-        time_to_close = self.time_to_market_close(current_time)
-        
         # If less than 15 minutes to market close, don't open new positions
         if 0 < time_to_close < 15:
+            self._no_new_positions_until_close = True
             self.logger.info(f"Less than 15 minutes to market close ({time_to_close:.2f} min). Not opening new positions.")
-            return []
+            return False
             
+        return True
+        
+    def generate_signals(self) -> List[Dict[str, Any]]:
+        """
+        Generate trading signals for day trading.
+        
+        Subclasses should return early when _can_open_positions() is False.
+        
+        Returns:
+            List[Dict]: List of signal dictionaries
+        """
+        self._can_open_positions()
+        
         # This should be implemented by subclasses
         return []
         
@@ -296,39 +557,29 @@ class DayStrategyBase(BaseStrategy):
         Returns:
             List[Dict]: Risk-adjusted signals
         """
-        if not signals:
+        # Skip everything if we've hit max trades for the day
+        if not signals or self._daily_trade_count >= self.max_daily_trades:
             return []
             
+        # Size positions against the remaining daily capital in one compiled pass
+        count = len(signals)
+        prices = np.fromiter((signal.get("price", 0) for signal in signals), dtype=np.float64, count=count)
+        sizes = np.fromiter((signal.get("size", 0) for signal in signals), dtype=np.float64, count=count)
+        
+        adjusted_sizes, accepted, self.remaining_daily_capital = _allocate_capital(
+            prices, sizes, self.remaining_daily_capital
+        )
+        
         risk_adjusted_signals = []
         
-        for signal in signals:
-            # Skip if we've hit max trades for the day
-            if len(self.daily_trades) >= self.max_daily_trades:
-                continue
-                
-            # Calculate position size based on remaining daily capital
-            estimated_size = signal.get("size", 0)
-            symbol = signal.get("symbol", "")
-            price = signal.get("price", 0)
+        for i in np.flatnonzero(accepted):
+            signal = signals[i]
             
-            if price <= 0 or estimated_size <= 0:
-                continue
-                
-            position_value = price * estimated_size
-            
-            # Adjust position size if it exceeds remaining daily capital
-            if position_value > self.remaining_daily_capital:
-                adjusted_size = int(self.remaining_daily_capital / price)
-                if adjusted_size <= 0:
-                    continue
-                    
-                self.logger.info(f"Adjusted position size for {symbol} from {estimated_size} to {adjusted_size}")
+            if adjusted_sizes[i] != sizes[i]:
+                adjusted_size = int(adjusted_sizes[i])
+                self.logger.info(f"Adjusted position size for {signal.get('symbol', '')} from {signal.get('size', 0)} to {adjusted_size}")
                 signal["size"] = adjusted_size
-                position_value = price * adjusted_size
                 
-            # Reserve the capital for this position
-            self.remaining_daily_capital -= position_value
-            
             risk_adjusted_signals.append(signal)
             
         return risk_adjusted_signals
@@ -342,6 +593,12 @@ class DayStrategyBase(BaseStrategy):
         """
         super().update_stats(trade_results)
         
+        # Track realized P&L for the day
+        realized_pnl = sum(result.get("profit", 0) for result in trade_results)
+        if realized_pnl:
+            self.daily_pnl += realized_pnl
+            self._daily_pnl_pct = self.daily_pnl * self._inv_max_daily_capital * 100.0
+            
         for result in trade_results:
             # Skip if not a new trade
             if result.get("type") != "new_position":
@@ -349,10 +606,12 @@ class DayStrategyBase(BaseStrategy):
                 
             # Add to daily trades
             self.daily_trades.append(result)
+            self._daily_trade_count += 1
             self.day_stats["trades"] += 1
             
             # Add to open positions
             self.open_positions.append(result)
+            self._open_position_count += 1
             
     def manage_positions(self) -> List[Dict[str, Any]]:
         """
@@ -361,13 +620,13 @@ class DayStrategyBase(BaseStrategy):
         Returns:
             List[Dict]: Results of position management actions
         """
-        current_time = datetime.now(pytz.UTC)
-        
         # If market is closing soon (< 5 minutes), close all positions
-        time_to_close = self.time_to_market_close(current_time)
-        if 0 < time_to_close < 5 and self.open_positions:
+        _, time_to_close = self._current_market_state()
+        if 0 < time_to_close < 5 and self._open_position_count:
             self.logger.info(f"Market closing in {time_to_close:.2f} minutes. Closing all positions.")
-            return self._close_all_positions()
+            results = self._close_all_positions()
+            self._forget_closed_positions(results)
+            return results
             
         # This should be implemented by subclasses
         return [] 
\ No newline at end of file
@@ -6,16 +6,156 @@ This strategy trades mean reversion to the Volume Weighted Average Price (VWAP)
 for liquid equities during the trading day.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+import math
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime, time, timedelta
 import pytz
 import pandas as pd
 import numpy as np
+from numba import njit
 
 from src.strategies.day_trading.day_strategy_base import DayStrategyBase
 from src.brokers.mt5_connector import MT5Connector
 from src.utils.logger import setup_logger
 
+# Signal names by classification code
+_SIGNAL_NAMES = {1: "buy", -1: "sell", 0: "none"}
+
+class _VWAPView:
+    """Read-only symbol -> VWAP values mapping over the strategy's column arrays."""
+    
+    # vwap_data field name -> column name
+    _FIELDS = {
+        "vwap": "vwap",
+        "current_price": "price",
+        "upper_band": "upper",
+        "lower_band": "lower",
+        "deviation": "deviation",
+        "std": "std",
+        "volume": "volume"
+    }
+    
+    def __init__(self, sym_idx: Dict[str, int], cols: Dict[str, np.ndarray]):
+        """
+        Initialize the view.
+        
+        Args:
+            sym_idx: Column index of each symbol
+            cols: Column arrays, including the 'valid' mask of symbols with data
+        """
+        self._sym_idx = sym_idx
+        self._cols = cols
+        
+    def __contains__(self, symbol: str) -> bool:
+        i = self._sym_idx.get(symbol)
+        return i is not None and bool(self._cols["valid"][i])
+        
+    def __getitem__(self, symbol: str) -> Dict[str, Any]:
+        if symbol not in self:
+            raise KeyError(symbol)
+            
+        i = self._sym_idx[symbol]
+        row = {field: float(self._cols[column][i]) for field, column in self._FIELDS.items()}
+        row["signal"] = _SIGNAL_NAMES[int(self._cols["signal"][i])]
+        return row
+        
+    def get(self, symbol: str, default: Any = None) -> Any:
+        return self[symbol] if symbol in self else default
+        
+    def items(self):
+        for symbol in self._sym_idx:
+            if symbol in self:
+                yield symbol, self[symbol]
+
+@lru_cache(maxsize=None)
+def _make_vwap_kernel(periods: int, num_std: float):
+    """
+    Build the VWAP kernel for one Bollinger Band configuration.
+    
+    The band window and width never change for a strategy, so they are baked into
+    the compiled kernel as constants rather than passed on every call.
+    
+    Args:
+        periods: Bollinger Band window
+        num_std: Bollinger Band width in standard deviations
+        
+    Returns:
+        Compiled kernel taking (high, low, close, volume, sum_vp, sum_v, diff_window)
+    """
+    @njit(cache=True)
+    def vwap_bands(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        sum_vp: float,
+        sum_v: float,
+        diff_window: np.ndarray
+    ):
+        """
+        Fold new bars into the running VWAP sums and compute the bands at the last bar.
+        
+        The last bar is still forming, so it is reflected in the returned VWAP and bands
+        but left out of the committed sums and difference window.
+        
+        Args:
+            high: High prices of the uncounted bars
+            low: Low prices of the uncounted bars
+            close: Close prices of the uncounted bars
+            volume: Volumes of the uncounted bars
+            sum_vp: Running sum of typical price * volume over the counted bars
+            sum_v: Running sum of volume over the counted bars
+            diff_window: Most recent price-VWAP differences of the counted bars
+            
+        Returns:
+            Tuple of (vwap, std, upper band, lower band, deviation,
+            committed sum_vp, committed sum_v, committed difference window)
+        """
+        n = close.shape[0]
+        m = diff_window.shape[0]
+        diffs = np.empty(m + n)
+        diffs[:m] = diff_window
+        
+        vwap = 0.0
+        committed_vp = sum_vp
+        committed_v = sum_v
+        for i in range(n):
+            if i == n - 1:
+                committed_vp = sum_vp
+                committed_v = sum_v
+            
+            sum_vp += (high[i] + low[i] + close[i]) / 3.0 * volume[i]
+            sum_v += volume[i]
+            vwap = sum_vp / sum_v
+            diffs[m + i] = close[i] - vwap
+        
+        # Sample standard deviation over the window, undefined until it fills
+        total = m + n
+        std = np.nan
+        if total >= periods and periods > 1:
+            mean = 0.0
+            for i in range(total - periods, total):
+                mean += diffs[i]
+            mean /= periods
+        
+            var = 0.0
+            for i in range(total - periods, total):
+                var += (diffs[i] - mean) ** 2
+            std = math.sqrt(var / (periods - 1))
+        
+        deviation = 0.0
+        if std > 0:
+            deviation = (close[n - 1] - vwap) / std
+        
+        committed_window = diffs[max(0, total - 1 - periods):total - 1]
+        return (
+            vwap, std, vwap + std * num_std, vwap - std * num_std, deviation,
+            committed_vp, committed_v, committed_window
+        )
+        
+    return vwap_bands
+
 class VWAPReversionStrategy(DayStrategyBase):
     """
     A day trading strategy that trades mean reversion to the VWAP for equities.
@@ -38,15 +178,38 @@ class VWAPReversionStrategy(DayStrategyBase):
         self.timeframe = config.get("timeframe", "M5")  # 5-minute timeframe
         self.min_volume = config.get("min_volume", 100000)  # Minimum volume for liquidity
         self.max_position_size = config.get("max_position_size", 100)  # Maximum position size in shares
+        self.risk_per_trade = config.get("risk_per_trade", 1.0)  # Percentage of account balance risked per trade
         
         # VWAP calculation parameters
         self.lookback_periods = config.get("lookback_periods", 20)  # Number of periods for VWAP calculation
         self.bollinger_periods = config.get("bollinger_periods", 20)  # Periods for Bollinger Bands
         self.bollinger_std = config.get("bollinger_std", 2.0)  # Standard deviations for Bollinger Bands
+        self._vwap_kernel = _make_vwap_kernel(int(self.bollinger_periods), float(self.bollinger_std))
         
         # Market data
         self.market_data = {}
-        self.vwap_data = {}
+        
+        # Latest VWAP values stored column-wise, one slot per symbol; vwap_data gives
+        # the per-symbol dict view of them
+        self._sym_idx = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._vwap_cols = {
+            "vwap": np.full(len(self.symbols), np.nan),
+            "price": np.full(len(self.symbols), np.nan),
+            "std": np.full(len(self.symbols), np.nan),
+            "upper": np.full(len(self.symbols), np.nan),
+            "lower": np.full(len(self.symbols), np.nan),
+            "deviation": np.zeros(len(self.symbols)),
+            "volume": np.zeros(len(self.symbols)),
+            "signal": np.zeros(len(self.symbols), dtype=np.int8),
+            "valid": np.zeros(len(self.symbols), dtype=bool)
+        }
+        self.vwap_data = _VWAPView(self._sym_idx, self._vwap_cols)
+        
+        # Running VWAP sums per symbol over the completed bars of the trading day
+        self._vwap_state = {}
+        
+        # Last bar each symbol's vwap_data was computed from
+        self._vwap_cache = {}
         
         # Broker connection
         self.broker = None
@@ -73,8 +236,17 @@ class VWAPReversionStrategy(DayStrategyBase):
             self.logger.error(f"Error connecting to broker: {str(e)}")
             return False
             
+        # Compile the VWAP kernel now rather than on the first bar
+        self._vwap_kernel(np.ones(1), np.ones(1), np.ones(1), np.ones(1), 0.0, 0.0, np.empty(0))
+            
         # Initialize parent
         return super().initialize()
+        
+    def _reset_daily_stats(self) -> None:
+        """Reset daily statistics and restart the running VWAP for the new day."""
+        super()._reset_daily_stats()
+        self._vwap_state.clear()
+        self._vwap_cache.clear()
     
     def analyze_market(self) -> Dict[str, Any]:
         """
@@ -116,87 +288,120 @@ class VWAPReversionStrategy(DayStrategyBase):
         if not self.broker:
             return
             
-        for symbol in self.symbols:
-            try:
-                # Get historical data
-                data = self.broker.get_historical_data(
-                    symbol,
-                    self.timeframe,
-                    self.lookback_periods + 10  # Add buffer
-                )
-                
-                if data is not None and not data.empty:
-                    # Store the data
-                    self.market_data[symbol] = data
-            except Exception as e:
-                self.logger.error(f"Error updating market data for {symbol}: {str(e)}")
+        try:
+            # Get historical data for every symbol in one batch
+            batch = self.broker.get_historical_data_batch(
+                self.symbols,
+                self.timeframe,
+                self.lookback_periods + 10  # Add buffer
+            )
+        except Exception as e:
+            self.logger.error(f"Error updating market data: {str(e)}")
+            return
+            
+        for symbol, data in batch.items():
+            if data is not None and len(data):
+                # Store the data
+                self.market_data[symbol] = data
+            else:
+                self.logger.warning(f"No market data returned for {symbol}")
     
+    def _new_vwap_state(self) -> Dict[str, Any]:
+        """Create empty running VWAP sums for a symbol."""
+        return {
+            "sum_vp": 0.0,
+            "sum_v": 0.0,
+            "diff_window": np.empty(0),
+            "last_ts": None
+        }
+        
     def _calculate_vwap(self) -> None:
-        """Calculate VWAP and Bollinger Bands for all symbols with available data."""
+        """
+        Calculate VWAP and Bollinger Bands for all symbols with available data.
+        
+        Completed bars are folded into running sums once, so each update only touches
+        bars that arrived since the previous call, in one compiled pass. The last bar is
+        still forming, so it is applied on top of the running sums without being
+        committed to them.
+        """
         for symbol, data in self.market_data.items():
             try:
-                if data is None or data.empty:
+                if data is None or len(data) == 0:
                     continue
                     
-                # Calculate VWAP
-                data = data.copy()
-                data['typical_price'] = (data['high'] + data['low'] + data['close']) / 3
-                data['volume_price'] = data['typical_price'] * data['tick_volume']
-                
-                # Calculate cumulative values
-                data['cumulative_volume'] = data['tick_volume'].cumsum()
-                data['cumulative_volume_price'] = data['volume_price'].cumsum()
-                
-                # Calculate VWAP
-                data['vwap'] = data['cumulative_volume_price'] / data['cumulative_volume']
-                
-                # Calculate standard deviation of price from VWAP
-                data['price_vwap_diff'] = data['close'] - data['vwap']
-                
-                # Calculate Bollinger Bands around VWAP
-                rolling_std = data['price_vwap_diff'].rolling(window=self.bollinger_periods).std()
-                data['upper_band'] = data['vwap'] + (rolling_std * self.bollinger_std)
-                data['lower_band'] = data['vwap'] - (rolling_std * self.bollinger_std)
-                
-                # Get latest values
-                latest = data.iloc[-1]
-                
-                # Get current price
-                current_price = latest['close']
-                vwap = latest['vwap']
-                upper_band = latest['upper_band']
-                lower_band = latest['lower_band']
-                
-                # Calculate deviation from VWAP (in standard deviations)
-                if rolling_std.iloc[-1] > 0:
-                    deviation = (current_price - vwap) / rolling_std.iloc[-1]
-                else:
-                    deviation = 0
-                
-                # Determine signal
-                signal = "none"
-                if current_price <= lower_band and deviation <= -self.vwap_deviation:
-                    signal = "buy"  # Price below lower band, potential buy
-                elif current_price >= upper_band and deviation >= self.vwap_deviation:
-                    signal = "sell"  # Price above upper band, potential sell
+                # Work on plain arrays rather than adding columns to the frame
+                times = data['time'].to_numpy()
+                high = data['high'].to_numpy(dtype=np.float64)
+                low = data['low'].to_numpy(dtype=np.float64)
+                close = data['close'].to_numpy(dtype=np.float64)
+                volume = data['tick_volume'].to_numpy(dtype=np.float64)
+                
+                # Nothing to do if the last bar has not changed since the previous call
+                last_bar = (times[-1], close[-1], high[-1], low[-1], volume[-1])
+                if symbol in self.vwap_data and self._vwap_cache.get(symbol) == last_bar:
+                    continue
+                    
+                state = self._vwap_state.get(symbol)
+                if state is None:
+                    state = self._vwap_state[symbol] = self._new_vwap_state()
+                    
+                # Bars not yet counted, always including the forming last bar
+                start = 0
+                if state["last_ts"] is not None:
+                    start = int(np.searchsorted(times[:-1], state["last_ts"], side="right"))
+                    
+                # Only the bars inside the band window need a per-bar VWAP; older ones
+                # just add to the running sums, in a single dot product
+                sum_vp = state["sum_vp"]
+                sum_v = state["sum_v"]
+                window_start = len(close) - 1 - self.bollinger_periods
+                if window_start > start:
+                    typical_price = (high[start:window_start] + low[start:window_start] + close[start:window_start]) / 3.0
+                    sum_vp += float(np.vdot(typical_price, volume[start:window_start]))
+                    sum_v += float(volume[start:window_start].sum())
+                    start = window_start
+                    
+                (
+                    vwap, std, upper_band, lower_band, deviation,
+                    state["sum_vp"], state["sum_v"], state["diff_window"]
+                ) = self._vwap_kernel(
+                    high[start:], low[start:], close[start:], volume[start:],
+                    sum_vp, sum_v, state["diff_window"]
+                )
+                state["last_ts"] = times[-2] if len(times) > 1 else state["last_ts"]
+                current_price = float(close[-1])
                 
                 # Calculate recent volume average
-                recent_volume_avg = data['tick_volume'].tail(5).mean()
+                recent_volume_avg = volume[-5:].mean()
                 
                 # Store VWAP data
-                self.vwap_data[symbol] = {
-                    "vwap": vwap,
-                    "current_price": current_price,
-                    "upper_band": upper_band,
-                    "lower_band": lower_band,
-                    "deviation": deviation,
-                    "signal": signal,
-                    "std": rolling_std.iloc[-1],
-                    "volume": recent_volume_avg
-                }
+                cols = self._vwap_cols
+                i = self._sym_idx[symbol]
+                cols["vwap"][i] = vwap
+                cols["price"][i] = current_price
+                cols["std"][i] = std
+                cols["upper"][i] = upper_band
+                cols["lower"][i] = lower_band
+                cols["deviation"][i] = deviation
+                cols["volume"][i] = recent_volume_avg
+                cols["valid"][i] = True
+                self._vwap_cache[symbol] = last_bar
                 
             except Exception as e:
                 self.logger.error(f"Error calculating VWAP for {symbol}: {str(e)}")
+                
+        self._classify_signals()
+        
+    def _classify_signals(self) -> None:
+        """Classify every symbol as buy (1), sell (-1) or no signal (0) in one vectorized pass."""
+        cols = self._vwap_cols
+        price = cols["price"]
+        deviation = cols["deviation"]
+        
+        # Price below lower band is a potential buy, above upper band a potential sell
+        buy_mask = (price <= cols["lower"]) & (deviation <= -self.vwap_deviation)
+        sell_mask = (price >= cols["upper"]) & (deviation >= self.vwap_deviation)
+        cols["signal"][:] = np.select([buy_mask, sell_mask], [1, -1], 0)
     
     def generate_signals(self) -> List[Dict[str, Any]]:
         """
@@ -205,110 +410,84 @@ class VWAPReversionStrategy(DayStrategyBase):
         Returns:
             List[Dict]: List of signal dictionaries
         """
-        # First call parent method to apply day trading constraints
-        parent_signals = super().generate_signals()
+        # Respect the day trading constraints
+        if not self._can_open_positions():
+            return []
         
-        # If parent says no trading, respect that
-        if not parent_signals and len(parent_signals) == 0:
+        # Check for new trade opportunities, only among symbols with a signal
+        cols = self._vwap_cols
+        eligible = np.flatnonzero((cols["signal"] != 0) & (cols["volume"] >= self.min_volume))
+        if len(eligible) == 0:
             return []
+            
+        # Skip symbols we already have a position in
+        held = self._held_symbols()
+        eligible = np.array([i for i in eligible if self.symbols[i] not in held], dtype=np.intp)
+        if len(eligible) == 0:
+            return []
+        
+        # Enter at the current price, stop beyond it and target the VWAP
+        codes = cols["signal"][eligible].astype(np.float64)
+        entry_prices = cols["price"][eligible]
+        stop_losses = entry_prices - codes * (cols["std"][eligible] * self.stop_loss)
+        take_profits = cols["vwap"][eligible]
+        deviations = cols["deviation"][eligible]
+        
+        # Size every position from the same account balance and risk budget
+        account_info = self.broker.get_account_info() if self.broker else {"balance": 10000}
+        risk_amount = account_info["balance"] * (self.risk_per_trade / 100)
+        
+        # Signals without a usable stop distance cannot be sized
+        risk_per_share = np.abs(entry_prices - stop_losses)
+        sizable = risk_per_share > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            position_sizes = np.maximum(
+                np.minimum(np.floor(risk_amount / risk_per_share), self.max_position_size), 1
+            )
         
         signals = []
         
-        # Check for new trade opportunities
-        for symbol, vwap_info in self.vwap_data.items():
-            try:
-                signal = vwap_info.get("signal", "none")
-                
-                # Skip if no signal or insufficient volume
-                if signal == "none" or vwap_info.get("volume", 0) < self.min_volume:
-                    continue
-                
-                # Check if we already have a position in this symbol
-                if self._has_open_position(symbol):
-                    continue
-                
-                current_price = vwap_info["current_price"]
-                vwap = vwap_info["vwap"]
-                std = vwap_info["std"]
-                
-                # Calculate entry, stop loss, and take profit prices
-                if signal == "buy":
-                    entry_price = current_price
-                    stop_loss = entry_price - (std * self.stop_loss)
-                    take_profit = vwap  # Target VWAP as profit target
-                    
-                elif signal == "sell":
-                    entry_price = current_price
-                    stop_loss = entry_price + (std * self.stop_loss)
-                    take_profit = vwap  # Target VWAP as profit target
-                else:
-                    continue
-                
-                # Calculate risk in dollars
-                risk_per_share = abs(entry_price - stop_loss)
-                
-                # Calculate position size based on risk
-                account_info = self.broker.get_account_info() if self.broker else {"balance": 10000}
-                risk_amount = account_info["balance"] * (self.risk_per_trade / 100)
-                
-                # Calculate position size
-                position_size = min(
-                    int(risk_amount / risk_per_share),
-                    self.max_position_size
-                )
-                
-                # Ensure minimum position size
-                if position_size < 1:
-                    position_size = 1
-                
-                # Create signal
-                trade_signal = {
-                    "symbol": symbol,
-                    "type": "market",
-                    "action": signal,
-                    "size": position_size,
-                    "price": entry_price,
-                    "stop_loss": stop_loss,
-                    "take_profit": take_profit,
-                    "reason": f"VWAP reversion ({signal})",
-                    "vwap": vwap,
-                    "deviation": vwap_info["deviation"]
-                }
-                
-                signals.append(trade_signal)
-                
-                self.logger.info(f"Generated {signal} signal for {symbol} at {entry_price:.2f}, size: {position_size}, " +
-                                f"SL: {stop_loss:.2f}, TP: {take_profit:.2f}, deviation: {vwap_info['deviation']:.2f} σ")
-                
-            except Exception as e:
-                self.logger.error(f"Error generating signal for {symbol}: {str(e)}")
+        for j in np.flatnonzero(sizable):
+            symbol = self.symbols[eligible[j]]
+            signal = _SIGNAL_NAMES[int(codes[j])]
+            position_size = int(position_sizes[j])
+            entry_price = float(entry_prices[j])
+            stop_loss = float(stop_losses[j])
+            take_profit = float(take_profits[j])
+            deviation = float(deviations[j])
+            
+            signals.append({
+                "symbol": symbol,
+                "type": "market",
+                "action": signal,
+                "size": position_size,
+                "price": entry_price,
+                "stop_loss": stop_loss,
+                "take_profit": take_profit,
+                "reason": f"VWAP reversion ({signal})",
+                "vwap": take_profit,
+                "deviation": deviation
+            })
+            
+            self.logger.info(f"Generated {signal} signal for {symbol} at {entry_price:.2f}, size: {position_size}, " +
+                            f"SL: {stop_loss:.2f}, TP: {take_profit:.2f}, deviation: {deviation:.2f} σ")
         
         return signals
     
-    def _has_open_position(self, symbol: str) -> bool:
+    def _held_symbols(self) -> Set[str]:
         """
-        Check if we already have an open position for a symbol.
+        Get the symbols we already have an open position in.
         
-        Args:
-            symbol: Symbol to check
-            
         Returns:
-            bool: True if we have an open position, False otherwise
+            Set[str]: Symbols held locally or reported by the broker
         """
-        # Check in our local open_positions list
-        for position in self.open_positions:
-            if position.get("symbol") == symbol:
-                return True
+        held = {position.get("symbol") for position in self.open_positions}
         
         # Double-check with broker if available
         if self.broker:
-            positions = self.broker.get_open_positions()
+            held.update(position.get("symbol") for position in self.broker.get_open_positions())
             
-            for position in positions:
-                if position.get("symbol") == symbol:
-                    return True
-        
-        return False
+        return held
     
     def execute_signals(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -320,55 +499,65 @@ class VWAPReversionStrategy(DayStrategyBase):
         Returns:
             List[Dict]: Results of the execution attempts
         """
-        results = []
-        
         if not self.broker:
-            return results
+            return []
             
-        for signal in signals:
-            try:
-                symbol = signal.get("symbol", "")
-                action = signal.get("action", "")
-                size = signal.get("size", 0)
-                stop_loss = signal.get("stop_loss", 0)
-                take_profit = signal.get("take_profit", 0)
-                
-                # Check for valid parameters
-                if not symbol or not action or size <= 0:
-                    continue
-                    
-                # Execute the trade
-                result = None
-                if action == "buy":
-                    result = self.broker.open_buy_position(symbol, size, stop_loss, take_profit)
-                elif action == "sell":
-                    result = self.broker.open_sell_position(symbol, size, stop_loss, take_profit)
-                    
-                if result and result.get("ticket", 0) > 0:
-                    self.logger.info(f"Executed {action} order for {symbol}, size: {size}, ticket: {result['ticket']}")
-                    
-                    # Add execution result
-                    execution_result = {
-                        "symbol": symbol,
-                        "action": action,
-                        "size": size,
-                        "price": result.get("price", 0),
-                        "ticket": result.get("ticket", 0),
-                        "time": datetime.now(),
-                        "type": "new_position",
-                        "stop_loss": stop_loss,
-                        "take_profit": take_profit,
-                        "reason": signal.get("reason", "")
-                    }
-                    
-                    results.append(execution_result)
-                else:
-                    self.logger.error(f"Failed to execute {action} order for {symbol}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error executing signal: {str(e)}")
+        # Place the orders concurrently in batches
+        results = self._dispatch_orders(signals, self._execute_signal)
+        
+        return [result for result in results if result]
+    
+    def _execute_signal(self, signal: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Place the order for a single signal.
+        
+        Args:
+            signal: Signal to execute
+            
+        Returns:
+            Optional[Dict]: Execution result, or None if the order was not placed
+        """
+        try:
+            symbol = signal.get("symbol", "")
+            action = signal.get("action", "")
+            size = signal.get("size", 0)
+            stop_loss = signal.get("stop_loss", 0)
+            take_profit = signal.get("take_profit", 0)
+            
+            # Check for valid parameters
+            if not symbol or not action or size <= 0:
+                return None
+                
+            # Execute the trade
+            result = None
+            if action == "buy":
+                result = self.broker.open_buy_position(symbol, size, stop_loss, take_profit)
+            elif action == "sell":
+                result = self.broker.open_sell_position(symbol, size, stop_loss, take_profit)
+                
+            if result and result.get("ticket", 0) > 0:
+                self.logger.info(f"Executed {action} order for {symbol}, size: {size}, ticket: {result['ticket']}")
+                
+                # Return execution result
+                return {
+                    "symbol": symbol,
+                    "action": action,
+                    "size": size,
+                    "price": result.get("price", 0),
+                    "ticket": result.get("ticket", 0),
+                    "time": datetime.now(),
+                    "type": "new_position",
+                    "stop_loss": stop_loss,
+                    "take_profit": take_profit,
+                    "reason": signal.get("reason", "")
+                }
                 
-        return results
+            self.logger.error(f"Failed to execute {action} order for {symbol}")
+            
+        except Exception as e:
+            self.logger.error(f"Error executing signal: {str(e)}")
+            
+        return None
     
     def manage_positions(self) -> List[Dict[str, Any]]:
         """
@@ -388,6 +577,17 @@ class VWAPReversionStrategy(DayStrategyBase):
         # Get all open positions
         open_positions = self.broker.get_open_positions()
         
+        # Forget tracked positions the broker has already closed, e.g. at their stop loss or take profit
+        broker_tickets = {position.get("ticket") for position in open_positions}
+        self._forget_positions(
+            position.get("ticket") for position in self.open_positions if position.get("ticket") not in broker_tickets
+        )
+        
+        # Decide every position's action first, then send them in bulk
+        to_close = []  # (ticket, symbol)
+        to_modify = []  # (ticket, new stop loss, take profit)
+        modified = []  # (symbol, current stop loss) for each entry in to_modify
+        
         for position in open_positions:
             try:
                 symbol = position.get("symbol", "")
@@ -409,30 +609,14 @@ class VWAPReversionStrategy(DayStrategyBase):
                 position_type = position.get("type", "")
                 is_buy = position_type == "buy"
                 
-                # Check if price has reached VWAP (our target)
+                # Check if price has reached VWAP (our target); no point adjusting a
+                # stop on a position that is being closed
                 if (is_buy and current_price >= vwap) or (not is_buy and current_price <= vwap):
-                    # Close the position
-                    result = self.broker.close_position(ticket)
-                    
-                    if result:
-                        profit = result.get("profit", 0)
-                        self.logger.info(f"Closed position {ticket} at VWAP, profit: {profit:.2f}")
-                        
-                        # Add result
-                        close_result = {
-                            "symbol": symbol,
-                            "ticket": ticket,
-                            "action": "close",
-                            "profit": profit,
-                            "time": datetime.now(),
-                            "type": "close_position",
-                            "reason": "Price reached VWAP target"
-                        }
-                        
-                        results.append(close_result)
+                    to_close.append((ticket, symbol))
+                    continue
                 
                 # Adjust stop loss as price moves toward VWAP
-                if symbol in self.market_data and not self.market_data[symbol].empty:
+                if symbol in self.market_data and len(self.market_data[symbol]):
                     std = vwap_info.get("std", 0)
                     
                     if std > 0:
@@ -460,27 +644,59 @@ class VWAPReversionStrategy(DayStrategyBase):
                         
                         # Update stop loss if changed
                         if new_sl != current_sl:
-                            result = self.broker.modify_position(ticket, new_sl, position.get("tp", 0))
-                            
-                            if result:
-                                self.logger.info(f"Updated stop loss for position {ticket} from {current_sl:.2f} to {new_sl:.2f}")
-                                
-                                # Add result
-                                modify_result = {
-                                    "symbol": symbol,
-                                    "ticket": ticket,
-                                    "action": "modify",
-                                    "new_sl": new_sl,
-                                    "time": datetime.now(),
-                                    "type": "modify_position",
-                                    "reason": "Adjusted stop loss based on price progress toward VWAP"
-                                }
-                                
-                                results.append(modify_result)
+                            to_modify.append((ticket, new_sl, position.get("tp", 0)))
+                            modified.append((symbol, current_sl))
                 
             except Exception as e:
                 self.logger.error(f"Error managing position: {str(e)}")
                 
+        if to_close:
+            close_results = self.broker.close_positions_bulk([ticket for ticket, _ in to_close])
+            
+            for (ticket, symbol), result in zip(to_close, close_results):
+                try:
+                    if result:
+                        profit = result.get("profit", 0)
+                        self.logger.info(f"Closed position {ticket} at VWAP, profit: {profit:.2f}")
+                        
+                        # Add result
+                        close_result = {
+                            "symbol": symbol,
+                            "ticket": ticket,
+                            "action": "close",
+                            "profit": profit,
+                            "time": datetime.now(),
+                            "type": "close_position",
+                            "reason": "Price reached VWAP target"
+                        }
+                        
+                        results.append(close_result)
+                        
+                except Exception as e:
+                    self.logger.error(f"Error managing position: {str(e)}")
+                    
+            self._forget_closed_positions(results)
+                    
+        if to_modify:
+            modify_results = self.broker.modify_positions_bulk(to_modify)
+            
+            for (ticket, new_sl, _), (symbol, current_sl), result in zip(to_modify, modified, modify_results):
+                if result:
+                    self.logger.info(f"Updated stop loss for position {ticket} from {current_sl:.2f} to {new_sl:.2f}")
+                    
+                    # Add result
+                    modify_result = {
+                        "symbol": symbol,
+                        "ticket": ticket,
+                        "action": "modify",
+                        "new_sl": new_sl,
+                        "time": datetime.now(),
+                        "type": "modify_position",
+                        "reason": "Adjusted stop loss based on price progress toward VWAP"
+                    }
+                    
+                    results.append(modify_result)
+                    
         return results
     
     def manage_risk(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -495,33 +711,38 @@ class VWAPReversionStrategy(DayStrategyBase):
         """
         # First apply the day trading risk management
         signals = super().manage_risk(signals)
+        if not signals:
+            return signals
         
-        risk_adjusted_signals = []
-        
-        for signal in signals:
-            symbol = signal.get("symbol", "")
-            
-            # Verify the signal is still valid (price hasn't moved significantly)
-            if symbol in self.vwap_data:
-                vwap_info = self.vwap_data[symbol]
-                current_price = vwap_info.get("current_price", 0)
-                signal_price = signal.get("price", 0)
-                
-                # Skip if price has moved too much from signal generation
-                price_diff_pct = abs(current_price - signal_price) / signal_price * 100
-                
-                if price_diff_pct > 0.2:  # 0.2% threshold
-                    self.logger.info(f"Skipping {symbol} signal, price moved {price_diff_pct:.2f}% since signal generation")
-                    continue
-                
-                # Ensure the signal direction still makes sense relative to VWAP
-                action = signal.get("action", "")
-                vwap = vwap_info.get("vwap", 0)
-                
-                if (action == "buy" and current_price > vwap) or (action == "sell" and current_price < vwap):
-                    self.logger.info(f"Skipping {symbol} {action} signal, price has already crossed VWAP")
-                    continue
+        # Look up every signal's symbol in the VWAP columns at once; signals for
+        # symbols without VWAP data pass through unchecked
+        cols = self._vwap_cols
+        count = len(signals)
+        rows = np.fromiter((self._sym_idx.get(signal.get("symbol", ""), -1) for signal in signals), dtype=np.intp, count=count)
+        tracked = rows >= 0
+        tracked[tracked] = cols["valid"][rows[tracked]]
+        if not tracked.any():
+            return signals
             
-            risk_adjusted_signals.append(signal)
+        rows[~tracked] = rows[tracked][0]
+        current_prices = cols["price"][rows]
+        vwaps = cols["vwap"][rows]
+        signal_prices = np.fromiter((signal.get("price", 0) for signal in signals), dtype=np.float64, count=count)
+        actions = [signal.get("action", "") for signal in signals]
+        is_buy = np.fromiter((action == "buy" for action in actions), dtype=bool, count=count)
+        is_sell = np.fromiter((action == "sell" for action in actions), dtype=bool, count=count)
+        
+        # Skip if price has moved too much from signal generation (0.2% threshold)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_diff_pct = np.abs(current_prices - signal_prices) / signal_prices * 100
+        moved = tracked & (price_diff_pct > 0.2)
+        
+        # Ensure the signal direction still makes sense relative to VWAP
+        crossed = tracked & ~moved & ((is_buy & (current_prices > vwaps)) | (is_sell & (current_prices < vwaps)))
+        
+        for i in np.flatnonzero(moved):
+            self.logger.info(f"Skipping {signals[i].get('symbol', '')} signal, price moved {price_diff_pct[i]:.2f}% since signal generation")
+        for i in np.flatnonzero(crossed):
+            self.logger.info(f"Skipping {signals[i].get('symbol', '')} {actions[i]} signal, price has already crossed VWAP")
         
-        return risk_adjusted_signals 
\ No newline at end of file
+        return [signals[i] for i in np.flatnonzero(~(moved | crossed))]
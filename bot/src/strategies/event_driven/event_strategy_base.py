@@ -4,16 +4,25 @@ Base class for event-driven trading strategies.
 These strategies react to market news, economic events, and other external triggers.
 """
 
+import heapq
+import itertools
 import threading
+import time
+from collections import defaultdict
 from typing import Dict, List, Any, Callable, Optional
 from datetime import datetime, timedelta
 
 from src.strategies.base_strategy import BaseStrategy
-from src.utils.logger import setup_logger
 
 class EventStrategyBase(BaseStrategy):
     """Base class for event-driven trading strategies."""
     
+    __slots__ = (
+        "event_sources", "event_types", "_event_type_set", "event_threshold", "reaction_delay",
+        "event_poll_interval", "_listeners_by_type", "_pending", "_event_seq", "event_lock",
+        "_event_cond", "_events_queued", "_queue_version", "event_thread", "event_thread_running"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the event-driven strategy base.
@@ -22,20 +31,31 @@ class EventStrategyBase(BaseStrategy):
             config: Strategy configuration dictionary
         """
         super().__init__(config)
-        self.logger = setup_logger(f"{self.__class__.__name__}", f"logs/strategies/{self.__class__.__name__}.log")
         
         # Event-specific configuration
         self.event_sources = config.get("event_sources", [])
         self.event_types = config.get("event_types", [])
+        self._event_type_set = frozenset(self.event_types)
         self.event_threshold = config.get("event_threshold", 0.5)
         self.reaction_delay = config.get("reaction_delay", 0.0)  # Delay in seconds
+        self.event_poll_interval = config.get("event_poll_interval", 1.0)  # Seconds between source polls
         
         # Event monitoring
-        self.event_listeners = []
-        self.event_queue = []
+        self._listeners_by_type = defaultdict(list)  # Event type -> callbacks
+        self._pending = []  # Heap of (fire time, sequence, event)
+        self._event_seq = itertools.count()  # Tiebreaker keeping equal fire times in arrival order
+        self.event_lock = threading.Lock()  # Guards the pending events across threads
+        self._event_cond = threading.Condition(self.event_lock)
+        self._events_queued = False
+        self._queue_version = 0  # Bumped whenever the pending events change
         self.event_thread = None
         self.event_thread_running = False
         
+    @property
+    def event_queue(self) -> List[Dict[str, Any]]:
+        """Snapshot of the events waiting to be processed, in no particular order."""
+        return [event for _, _, event in self._pending]
+        
     def initialize(self) -> bool:
         """
         Initialize the event-driven strategy.
@@ -58,21 +78,36 @@ class EventStrategyBase(BaseStrategy):
         """Background thread for monitoring events from various sources."""
         self.logger.info("Event monitoring loop started")
         
+        next_poll = time.monotonic()
+        
         while self.event_thread_running:
             try:
                 # Check for new events from all sources
-                for source in self.event_sources:
-                    new_events = self._poll_event_source(source)
-                    if new_events:
-                        self.event_queue.extend(new_events)
-                        self.logger.info(f"Received {len(new_events)} new events from {source}")
+                if time.monotonic() >= next_poll:
+                    next_poll = time.monotonic() + self.event_poll_interval
+                    
+                    for source in self.event_sources:
+                        new_events = self._poll_event_source(source)
+                        if new_events:
+                            self._queue_events(new_events)
+                            self.logger.info(f"Received {len(new_events)} new events from {source}")
                 
                 # Process any events in the queue
-                if self.event_queue:
+                if self._pending:
                     self._process_event_queue()
                     
-                # Sleep to avoid excessive CPU usage
-                threading.Event().wait(1.0)  # 1-second polling interval
+                # Sleep until the next poll or queued event is due, waking early when
+                # events are queued or the strategy stops
+                with self._event_cond:
+                    timeout = next_poll - time.monotonic()
+                    if self._pending:
+                        timeout = min(timeout, (self._pending[0][0] - datetime.now()).total_seconds())
+                        
+                    self._event_cond.wait_for(
+                        lambda: self._events_queued or not self.event_thread_running,
+                        timeout=max(timeout, 0.0)
+                    )
+                    self._events_queued = False
                 
             except Exception as e:
                 self.logger.error(f"Error in event monitoring loop: {str(e)}")
@@ -90,25 +125,51 @@ class EventStrategyBase(BaseStrategy):
         # Implement specific polling logic for different event sources
         return []
     
+    def _queue_events(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Add events to the event queue.
+        
+        Each event's timestamp is parsed once here, and the time it becomes ready
+        (timestamp plus reaction delay) is stored as '_fire_at'. Events without a
+        timestamp are stamped with the time they were queued.
+        
+        Args:
+            events: Event dictionaries to queue
+        """
+        received_time = datetime.now()
+        delay = timedelta(seconds=self.reaction_delay)
+        
+        for event in events:
+            event_time = event.get("timestamp")
+            if event_time is None:
+                event_time = event["timestamp"] = received_time
+            elif isinstance(event_time, str):
+                event_time = event["timestamp"] = datetime.fromisoformat(event_time)
+                
+            event["_fire_at"] = event_time + delay
+            
+        with self._event_cond:
+            for event in events:
+                heapq.heappush(self._pending, (event["_fire_at"], next(self._event_seq), event))
+            self._queue_version += 1
+            self._events_queued = True
+            self._event_cond.notify()
+    
     def _process_event_queue(self) -> None:
         """Process events in the event queue."""
         current_time = datetime.now()
-        processed_events = []
-        
-        for event in self.event_queue:
-            # Check if the event is ready to be processed (accounting for reaction delay)
-            event_time = event.get("timestamp", current_time)
-            if isinstance(event_time, str):
-                event_time = datetime.fromisoformat(event_time)
-                
-            if current_time >= event_time + timedelta(seconds=self.reaction_delay):
-                # Process the event
-                self._process_event(event)
-                processed_events.append(event)
-        
-        # Remove processed events from the queue
-        for event in processed_events:
-            self.event_queue.remove(event)
+        ready_events = []
+        
+        # Pop the events that are due (accounting for reaction delay) in fire order
+        with self.event_lock:
+            while self._pending and self._pending[0][0] <= current_time:
+                ready_events.append(heapq.heappop(self._pending)[2])
+            if ready_events:
+                self._queue_version += 1
+        
+        # Process outside the lock, since reactions may queue new events
+        for event in ready_events:
+            self._process_event(event)
     
     def _process_event(self, event: Dict[str, Any]) -> None:
         """
@@ -123,9 +184,11 @@ class EventStrategyBase(BaseStrategy):
         self.logger.info(f"Processing event: {event_type} (importance: {event_importance})")
         
         # Only react to events that meet the threshold
-        if event_importance >= self.event_threshold and event_type in self.event_types:
+        if event_importance >= self.event_threshold and event_type in self._event_type_set:
             self.logger.info(f"Event meets threshold, triggering reaction")
             self._react_to_event(event)
+            for callback in self._listeners_by_type.get(event_type, ()):
+                callback(event)
     
     def _react_to_event(self, event: Dict[str, Any]) -> None:
         """
@@ -145,15 +208,14 @@ class EventStrategyBase(BaseStrategy):
             event_type: Type of event to listen for
             callback: Callback function to invoke when event occurs
         """
-        self.event_listeners.append({
-            "event_type": event_type,
-            "callback": callback
-        })
+        self._listeners_by_type[event_type].append(callback)
         
     def stop(self) -> None:
         """Stop the strategy execution."""
         self.logger.info("Stopping event-driven strategy")
-        self.event_thread_running = False
+        with self._event_cond:
+            self.event_thread_running = False
+            self._event_cond.notify()
         if self.event_thread and self.event_thread.is_alive():
             self.event_thread.join(timeout=5.0)
         super().stop()
@@ -167,7 +229,7 @@ class EventStrategyBase(BaseStrategy):
         """
         # Basic implementation - should be enhanced in subclasses
         return {
-            "event_count": len(self.event_queue),
+            "event_count": len(self._pending),
             "last_processed_time": datetime.now(),
             "market_sentiment": self._calculate_event_sentiment()
         }
@@ -6,19 +6,80 @@ This strategy monitors news feeds and financial calendars for market-moving even
 and places trades based on the expected market impact of these events.
 """
 
+import heapq
 import re
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 import pytz
 import pandas as pd
 import numpy as np
+from numba import njit
 from loguru import logger
 
 from src.strategies.event_driven.event_strategy_base import EventStrategyBase
 from src.brokers.mt5_connector import MT5Connector
 from src.utils.logger import setup_logger
 
+@dataclass(slots=True)
+class TradeSignal:
+    """Trade signal generated from a news reaction."""
+    symbol: str
+    action: str
+    size: float
+    stop_loss: float
+    take_profit: float
+    reason: str
+    entry_time: datetime
+    exit_time: datetime
+    importance: float = 0.0
+    type: str = "market"
+
+@njit(cache=True)
+def _size_stop_target(
+    balance: float,
+    risk_percent: float,
+    stop_pips: float,
+    point: float,
+    close: float,
+    direction: int,
+    target_ratio: float,
+    lot_step: float,
+    pip_value: float
+):
+    """
+    Size a news trade and place its stop loss and take profit in one pass.
+    
+    Args:
+        balance: Account balance
+        risk_percent: Percentage of balance to risk
+        stop_pips: Stop loss distance in pips
+        point: Price of one pip
+        close: Entry price
+        direction: Trade direction (1 for buy, -1 for sell)
+        target_ratio: Take profit distance as a multiple of the stop distance
+        lot_step: Volume step of the symbol, 0 if unknown
+        pip_value: Value of one pip per lot, 0 if unknown
+        
+    Returns:
+        Tuple of (position size, stop loss price, take profit price)
+    """
+    # Default to minimum position size
+    position_size = 0.01
+    if stop_pips > 0 and lot_step > 0 and pip_value > 0:
+        risk_amount = balance * (risk_percent / 100)
+        
+        # Round to standard lot size
+        position_size = round(risk_amount / (stop_pips * pip_value) / lot_step) * lot_step
+        
+    side = 1.0 if direction > 0 else -1.0
+    stop_loss = close - side * (stop_pips * point)
+    take_profit = close + side * (stop_pips * target_ratio * point)
+    return position_size, stop_loss, take_profit
+
 class NewsImpactStrategy(EventStrategyBase):
     """
     A strategy that trades based on the impact of economic news releases and events.
@@ -43,6 +104,10 @@ class NewsImpactStrategy(EventStrategyBase):
         "NZD": ["NZDUSD", "EURNZD", "GBPNZD", "NZDJPY", "AUDNZD", "NZDCAD", "NZDCHF"]
     }
     
+    # Every traded symbol once, in ID order; per-symbol market data is stored in arrays by ID
+    SYMBOL_BY_ID = tuple(sorted({symbol for symbols in CURRENCY_SYMBOLS.values() for symbol in symbols}))
+    SYMBOL_ID = {symbol: symbol_id for symbol_id, symbol in enumerate(SYMBOL_BY_ID)}
+    
     # News categories to event types mapping
     NEWS_CATEGORIES = {
         "interest_rate": ["rate decision", "interest rate", "fed", "fomc", "boe", "ecb", "rba", "boj"],
@@ -55,6 +120,27 @@ class NewsImpactStrategy(EventStrategyBase):
         "trade": ["trade balance", "export", "import", "trade deficit"]
     }
     
+    # All category keywords in one pattern, one named group per category in priority
+    # order. The lookahead reports a match at every position, so overlapping keywords
+    # are not skipped.
+    _CATEGORY_PATTERN = re.compile("(?=(?:" + "|".join(
+        f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+        for category, keywords in NEWS_CATEGORIES.items()
+    ) + "))")
+    _CATEGORY_RANK = {category: rank for rank, category in enumerate(NEWS_CATEGORIES)}
+    
+    # First number in a release figure such as "200K" or "-0.3%"
+    _NUMBER_PATTERN = re.compile(r'-?\d+\.?\d*')
+    
+    __slots__ = (
+        "impact_threshold", "pre_news_buffer", "post_news_reaction", "position_hold_time",
+        "news_volatility_factor", "risk_per_trade", "target_profit_ratio", "max_spread_factor",
+        "signal_queue", "max_signal_queue", "_deferred", "_sentiment_cache", "_event_handlers", "_currency_to_symbols",
+        "avg_spreads", "avg_volatility", "_stop_pips", "_sizing_info",
+        "news_calendar", "_high_impact_epochs", "last_calendar_update", "calendar_update_interval",
+        "_calendar_next_update", "broker", "mt5_config_path", "_data_pool"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the news impact strategy.
@@ -76,17 +162,46 @@ class NewsImpactStrategy(EventStrategyBase):
         self.target_profit_ratio = config.get("target_profit_ratio", 2.0)  # Risk-reward ratio
         self.max_spread_factor = config.get("max_spread_factor", 1.5)  # Maximum spread as multiple of average
         
-        # Market data
-        self.avg_spreads = {}
-        self.avg_volatility = {}
-        self.news_calendar = pd.DataFrame()
+        # Trade signals from event reactions waiting for generate_signals, as a heap of
+        # (-importance, sequence, signal) so the most important signals are sent first
+        self.signal_queue = []
+        self.max_signal_queue = config.get("max_signal_queue", 1024)  # Least important signals beyond this are dropped
+        
+        # News events waiting for the market to react, as a heap of (run time, sequence, event)
+        self._deferred = []
+        
+        # (pending events version, score) of the last sentiment calculation
+        self._sentiment_cache = (-1, 0.0)
+        
+        # Event type -> reaction handler
+        self._event_handlers = {
+            "economic_release": self._react_to_economic_release
+        }
+        
+        # Immutable symbol lookups, built once from CURRENCY_SYMBOLS
+        self._currency_to_symbols = {
+            currency: tuple(symbols) for currency, symbols in self.CURRENCY_SYMBOLS.items()
+        }
+        
+        # Market data, indexed by symbol ID; 0 until loaded. avg_spreads has a trailing
+        # 0 slot at index -1 for symbols outside CURRENCY_SYMBOLS, so they skip the spread check
+        self.avg_spreads = np.zeros(len(self.SYMBOL_BY_ID) + 1)
+        self.avg_volatility = np.zeros(len(self.SYMBOL_BY_ID))
+        self._stop_pips = np.zeros(len(self.SYMBOL_BY_ID))  # Volatility-based stop distance in pips
+        self._sizing_info = {}  # (lot step, pip value) per symbol
+        self.news_calendar = {"epoch": np.empty(0)}  # Calendar columns, sorted by event epoch
+        self._high_impact_epochs = np.empty(0)  # Sorted event epochs of the calendar's high-impact events
         self.last_calendar_update = None
         self.calendar_update_interval = config.get("calendar_update_interval", 3600)  # Seconds
+        self._calendar_next_update = 0.0  # Monotonic time the calendar is next refreshed
         
         # Broker connection
         self.broker = None
         self.mt5_config_path = config.get("mt5_config_path", "config/brokers/mt5_config.json")
         
+        # Worker threads for overlapping per-symbol broker requests
+        self._data_pool = ThreadPoolExecutor(max_workers=config.get("data_workers", 8))
+        
     def initialize(self) -> bool:
         """
         Initialize the news impact strategy.
@@ -114,6 +229,9 @@ class NewsImpactStrategy(EventStrategyBase):
         # Load economic calendar
         self._update_economic_calendar()
         
+        # Compile the sizing kernel now rather than on the first news reaction
+        _size_stop_target(1.0, 1.0, 1.0, 1.0, 1.0, 1, 1.0, 1.0, 1.0)
+        
         # Initialize event monitoring
         result = super().initialize()
         
@@ -123,43 +241,61 @@ class NewsImpactStrategy(EventStrategyBase):
         """Load historical market data for volatility calculation."""
         self.logger.info("Loading market data for volatility analysis")
         
-        for currency, symbols in self.CURRENCY_SYMBOLS.items():
-            for symbol in symbols:
-                try:
-                    # Get historical data
-                    if self.broker:
-                        df = self.broker.get_historical_data(symbol, "H1", 100)
+        if not self.broker:
+            return
+            
+        def fetch(symbol: str) -> Tuple[Optional[pd.DataFrame], Any, float]:
+            # Get historical data, plus symbol info and pip value when there is data
+            df = self.broker.get_historical_data(symbol, "H1", 100)
+            symbol_info = None
+            pip_value = 0.0
+            if df is not None and not df.empty and hasattr(self.broker, 'get_symbol_info'):
+                symbol_info = self.broker.get_symbol_info(symbol)
+                if symbol_info:
+                    pip_value = self.broker.get_pip_value(symbol)
+            return df, symbol_info, pip_value
+            
+        # Each symbol once, although most appear under two currencies; the broker
+        # requests overlap on worker threads and results are stored here
+        futures = [self._data_pool.submit(fetch, symbol) for symbol in self.SYMBOL_BY_ID]
+        
+        for symbol_id, (symbol, future) in enumerate(zip(self.SYMBOL_BY_ID, futures)):
+            try:
+                df, symbol_info, pip_value = future.result()
+                
+                if df is not None and not df.empty:
+                    # Calculate average volatility (high-low range)
+                    volatility = (df['high'] - df['low']).mean()
+                    self.avg_volatility[symbol_id] = volatility
+                    
+                    # Calculate average spread, and keep the static sizing inputs
+                    if symbol_info:
+                        self.avg_spreads[symbol_id] = symbol_info.spread * self.broker.point
+                        self._sizing_info[symbol] = (symbol_info.volume_step, pip_value)
                         
-                        if df is not None and not df.empty:
-                            # Calculate average volatility (high-low range)
-                            volatility = (df['high'] - df['low']).mean()
-                            self.avg_volatility[symbol] = volatility
-                            
-                            # Calculate average spread
-                            if hasattr(self.broker, 'get_symbol_info'):
-                                symbol_info = self.broker.get_symbol_info(symbol)
-                                if symbol_info:
-                                    self.avg_spreads[symbol] = symbol_info.spread * self.broker.point
-                                
-                            self.logger.info(f"Loaded data for {symbol}: Volatility = {volatility:.5f}")
-                except Exception as e:
-                    self.logger.error(f"Error loading data for {symbol}: {str(e)}")
+                    # Precompute the stop distance used for every signal on this symbol
+                    point = self.broker.point
+                    if volatility > 0 and point > 0:
+                        self._stop_pips[symbol_id] = volatility * self.news_volatility_factor / point
+                        
+                    self.logger.info(f"Loaded data for {symbol}: Volatility = {volatility:.5f}")
+            except Exception as e:
+                self.logger.error(f"Error loading data for {symbol}: {str(e)}")
         
     def _update_economic_calendar(self) -> None:
         """Update the economic calendar data."""
-        now = datetime.now()
-        
         # Only update if it's been more than the update interval since last update
-        if (self.last_calendar_update is None or 
-                (now - self.last_calendar_update).total_seconds() > self.calendar_update_interval):
-            
-            self.logger.info("Updating economic calendar")
-            
-            # TODO: Implement actual economic calendar API call
-            # For now, we'll create a sample calendar
-            self._create_sample_calendar()
+        if time.monotonic() < self._calendar_next_update:
+            return
             
-            self.last_calendar_update = now
+        self.logger.info("Updating economic calendar")
+        
+        # TODO: Implement actual economic calendar API call
+        # For now, we'll create a sample calendar
+        self._create_sample_calendar()
+        
+        self.last_calendar_update = datetime.now()
+        self._calendar_next_update = time.monotonic() + self.calendar_update_interval
     
     def _create_sample_calendar(self) -> None:
         """Create a sample economic calendar for testing."""
@@ -216,46 +352,71 @@ class NewsImpactStrategy(EventStrategyBase):
             }
         ]
         
-        # Create DataFrame
-        self.news_calendar = pd.DataFrame(events)
+        # Absolute event times, so the time left can be measured at any later poll
+        now = datetime.now()
+        epochs = time.time() + np.array([(event["datetime"] - now).total_seconds() for event in events])
+        order = np.argsort(epochs, kind="stable")
+        events = [events[i] for i in order]
         
-        # Add derived information
-        if not self.news_calendar.empty:
-            self.news_calendar["time_until"] = self.news_calendar["datetime"].apply(
-                lambda x: (x - datetime.now()).total_seconds() / 60
-            )
+        # Store the calendar as columns sorted by event time
+        calendar = {"epoch": epochs[order]}
+        for column in ("datetime", "country", "currency", "event", "impact", "forecast", "previous"):
+            calendar[column] = np.array([event[column] for event in events], dtype=object)
             
-            # Categorize events
-            self.news_calendar["category"] = self.news_calendar["event"].apply(self._categorize_event)
+        # Normalize names once so every classifier reads the lowercased columns
+        calendar["event_lc"] = np.array([str(name).lower() for name in calendar["event"]], dtype=object)
+        calendar["impact_lc"] = np.array([str(impact).lower() for impact in calendar["impact"]], dtype=object)
+        
+        # Parse forecast and previous figures once, NaN where there is no number
+        for column in ("forecast", "previous"):
+            values = [self._extract_number(value) for value in calendar[column]]
+            calendar[f"{column}_val"] = np.array([np.nan if value is None else value for value in values])
             
-            # Convert impact to numeric
-            self.news_calendar["impact_value"] = self.news_calendar["impact"].apply(
-                lambda x: self.IMPACT_LEVELS.get(x.lower(), 0) if isinstance(x, str) else 0
-            )
+        # Categorize events; names are matched once each and memoised
+        calendar["category"] = np.array([self._categorize_event(name) for name in calendar["event_lc"]], dtype=object)
+        
+        # Convert impact to numeric
+        calendar["impact_value"] = np.array([self.IMPACT_LEVELS.get(impact, 0.0) for impact in calendar["impact_lc"]])
+        
+        self.news_calendar = calendar
+        
+        # Impact never changes once loaded, so keep the high-impact events aside
+        self._high_impact_epochs = calendar["epoch"][calendar["impact_value"] >= self.impact_threshold]
+        
+        self.logger.info(f"Created sample calendar with {len(events)} events")
+    
+    @staticmethod
+    def _events_within(epochs: np.ndarray, horizon: float) -> Tuple[int, int]:
+        """
+        Find the events due within a time horizon.
+        
+        Args:
+            epochs: Sorted event epochs
+            horizon: Seconds from now to look ahead
             
-            self.logger.info(f"Created sample calendar with {len(events)} events")
+        Returns:
+            Tuple[int, int]: Index range of the events due after now and no later than now + horizon
+        """
+        now = time.time()
+        return (
+            int(np.searchsorted(epochs, now, side="right")),
+            int(np.searchsorted(epochs, now + horizon, side="right"))
+        )
     
-    def _categorize_event(self, event_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _categorize_event(event_lower: str) -> str:
         """
-        Categorize an event based on its name.
+        Categorize an event by the highest-priority category with a keyword in its name.
         
         Args:
-            event_name: Name of the event
+            event_lower: Lowercased name of the event
             
         Returns:
             str: Category of the event
         """
-        if not isinstance(event_name, str):
-            return "other"
-            
-        event_lower = event_name.lower()
-        
-        for category, keywords in self.NEWS_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword in event_lower:
-                    return category
-                    
-        return "other"
+        matched = {match.lastgroup for match in NewsImpactStrategy._CATEGORY_PATTERN.finditer(event_lower)}
+        return min(matched, key=NewsImpactStrategy._CATEGORY_RANK.get, default="other")
     
     def _poll_event_source(self, source: str) -> List[Dict[str, Any]]:
         """
@@ -273,28 +434,29 @@ class NewsImpactStrategy(EventStrategyBase):
             
             # Look for upcoming events
             upcoming_events = []
+            calendar = self.news_calendar
             
-            if not self.news_calendar.empty:
-                # Filter events occurring soon (within next 30 minutes)
-                soon = self.news_calendar[
-                    (self.news_calendar["time_until"] <= 30) & 
-                    (self.news_calendar["time_until"] > 0)
-                ]
+            # Events occurring soon (within next 30 minutes) form a contiguous run of the sorted calendar
+            lo, hi = self._events_within(calendar["epoch"], 30 * 60)
+            if lo < hi:
+                minutes_until = (calendar["epoch"][lo:hi] - time.time()) / 60
                 
                 # Convert to event dictionaries
-                for _, row in soon.iterrows():
+                for i, time_until in zip(range(lo, hi), minutes_until.tolist()):
                     event = {
                         "type": "economic_release",
                         "source": "economic_calendar",
-                        "timestamp": row["datetime"],
-                        "country": row["country"],
-                        "currency": row["currency"],
-                        "event": row["event"],
-                        "category": row.get("category", "other"),
-                        "importance": row.get("impact_value", 0),
-                        "forecast": row.get("forecast", ""),
-                        "previous": row.get("previous", ""),
-                        "time_until_minutes": row.get("time_until", 0)
+                        "timestamp": calendar["datetime"][i],
+                        "country": calendar["country"][i],
+                        "currency": calendar["currency"][i],
+                        "event": calendar["event"][i],
+                        "category": calendar["category"][i],
+                        "importance": float(calendar["impact_value"][i]),
+                        "forecast": calendar["forecast"][i],
+                        "previous": calendar["previous"][i],
+                        "forecast_val": float(calendar["forecast_val"][i]),
+                        "previous_val": float(calendar["previous_val"][i]),
+                        "time_until_minutes": time_until
                     }
                     upcoming_events.append(event)
                     
@@ -310,10 +472,9 @@ class NewsImpactStrategy(EventStrategyBase):
         Args:
             event: Event dictionary
         """
-        event_type = event.get("type", "")
-        
-        if event_type == "economic_release":
-            self._react_to_economic_release(event)
+        handler = self._event_handlers.get(event.get("type", ""))
+        if handler is not None:
+            handler(event)
     
     def _react_to_economic_release(self, event: Dict[str, Any]) -> None:
         """
@@ -322,27 +483,35 @@ class NewsImpactStrategy(EventStrategyBase):
         Args:
             event: Economic release event dictionary
         """
-        currency = event.get("currency", "")
+        # Only high-impact events are acted on, so drop the rest before any other work
         importance = event.get("importance", 0)
+        if importance < self.impact_threshold:
+            return
+            
+        currency = event.get("currency", "")
         time_until = event.get("time_until_minutes", 0)
         event_name = event.get("event", "")
         
-        self.logger.info(f"Processing economic release: {event_name} ({currency}), importance: {importance:.2f}, time until: {time_until:.1f} min")
+        # Lazy formatting; the message is only built if INFO is enabled
+        self.logger.info(
+            "Processing economic release: %s (%s), importance: %.2f, time until: %.1f min",
+            event_name, currency, importance, time_until
+        )
         
-        # If the event is high-impact and about to happen, close existing positions on affected symbols
-        if importance >= self.impact_threshold and time_until <= self.pre_news_buffer:
+        # If the event is about to happen, close existing positions on affected symbols
+        if time_until <= self.pre_news_buffer:
             affected_symbols = self._get_affected_symbols(currency)
             
             if affected_symbols:
                 self.logger.info(f"High-impact event approaching. Closing positions for: {', '.join(affected_symbols)}")
                 self._close_positions_for_symbols(affected_symbols)
         
-        # If the event just happened and is high-impact, generate trading signals
-        if importance >= self.impact_threshold and 0 <= time_until <= self.post_news_reaction:
+        # If the event just happened, generate trading signals
+        if 0 <= time_until <= self.post_news_reaction:
             self.logger.info(f"High-impact event just released. Generating trading signals.")
             self._generate_post_news_signals(event)
     
-    def _get_affected_symbols(self, currency: str) -> List[str]:
+    def _get_affected_symbols(self, currency: str) -> Tuple[str, ...]:
         """
         Get the symbols affected by news for a specific currency.
         
@@ -350,11 +519,11 @@ class NewsImpactStrategy(EventStrategyBase):
             currency: Currency code
             
         Returns:
-            List[str]: List of affected symbols
+            Tuple[str, ...]: Affected symbols
         """
-        return self.CURRENCY_SYMBOLS.get(currency, [])
+        return self._currency_to_symbols.get(currency, ())
     
-    def _close_positions_for_symbols(self, symbols: List[str]) -> None:
+    def _close_positions_for_symbols(self, symbols: Sequence[str]) -> None:
         """
         Close all open positions for specific symbols.
         
@@ -373,31 +542,65 @@ class NewsImpactStrategy(EventStrategyBase):
     
     def _generate_post_news_signals(self, event: Dict[str, Any]) -> None:
         """
-        Generate trading signals after a news event.
+        Schedule signal generation once the market has had time to react to a news event.
         
         Args:
             event: News event dictionary
         """
-        currency = event.get("currency", "")
-        event_name = event.get("event", "")
-        category = event.get("category", "other")
+        if not self._get_affected_symbols(event.get("currency", "")) or not self.broker:
+            return
+            
+        # Wait for the market to react without blocking event monitoring
+        run_at = time.monotonic() + self.post_news_reaction * 60
+        with self.event_lock:
+            heapq.heappush(self._deferred, (run_at, next(self._event_seq), event))
+            
+    def _run_deferred_analyses(self) -> None:
+        """Analyze the market reaction to every news event whose reaction time has passed."""
+        due_events = []
+        now = time.monotonic()
         
-        affected_symbols = self._get_affected_symbols(currency)
+        with self.event_lock:
+            while self._deferred and self._deferred[0][0] <= now:
+                due_events.append(heapq.heappop(self._deferred)[2])
+                
+        for event in due_events:
+            self._analyze_news_reaction(event)
+            
+    def _analyze_news_reaction(self, event: Dict[str, Any]) -> None:
+        """
+        Generate trading signals from the initial price movement after a news event.
         
-        if not affected_symbols:
+        Args:
+            event: News event dictionary
+        """
+        event_name = event.get("event", "")
+        importance = event.get("importance", 0)
+        affected_symbols = self._get_affected_symbols(event.get("currency", ""))
+        
+        # The balance is the same for every symbol
+        try:
+            balance = self.broker.get_account_info()["balance"]
+        except Exception as e:
+            self.logger.error(f"Error getting account info: {str(e)}")
             return
             
-        # Wait for the market to react
-        time.sleep(self.post_news_reaction * 60)
+        point = self.broker.point
+        
+        # Signals from this event share one entry and exit time
+        entry_time = datetime.now()
+        exit_time = entry_time + timedelta(minutes=self.position_hold_time)
+        
+        # Get recent price data for every symbol at once
+        futures = [
+            self._data_pool.submit(self.broker.get_current_price_data, symbol)
+            for symbol in affected_symbols
+        ]
         
         # Analyze the initial price movement
-        for symbol in affected_symbols:
+        for symbol, future in zip(affected_symbols, futures):
             try:
-                if not self.broker:
-                    continue
-                    
-                # Get recent price data
-                current_data = self.broker.get_current_price_data(symbol)
+                current_data = future.result()
                 
                 if not current_data:
                     continue
@@ -408,37 +611,52 @@ class NewsImpactStrategy(EventStrategyBase):
                 if direction == 0:
                     continue
                     
-                # Calculate position size
-                account_info = self.broker.get_account_info()
-                position_size = self._calculate_position_size(
-                    symbol, 
-                    account_info["balance"], 
+                # Lot step and pip value for sizing, loaded with the market data when
+                # the broker knows the symbol
+                sizing_info = self._sizing_info.get(symbol)
+                if sizing_info is not None:
+                    lot_step, pip_value = sizing_info
+                else:
+                    lot_step = pip_value = 0.0
+                    symbol_info = self.broker.get_symbol_info(symbol)
+                    if symbol_info:
+                        lot_step = symbol_info.volume_step
+                        pip_value = self.broker.get_pip_value(symbol)
+                    
+                # Calculate position size, stop loss and take profit
+                position_size, stop_loss, take_profit = _size_stop_target(
+                    balance,
                     self.risk_per_trade,
-                    current_data
+                    self._calculate_stop_loss_pips(symbol, current_data),
+                    point,
+                    current_data["close"],
+                    direction,
+                    self.target_profit_ratio,
+                    lot_step,
+                    pip_value
                 )
                 
                 # Generate signal
-                signal = {
-                    "symbol": symbol,
-                    "type": "market",
-                    "action": "buy" if direction > 0 else "sell",
-                    "size": position_size,
-                    "reason": f"News reaction: {event_name}",
-                    "stop_loss": self._calculate_stop_loss(symbol, direction, current_data),
-                    "take_profit": self._calculate_take_profit(symbol, direction, current_data),
-                    "entry_time": datetime.now(),
-                    "exit_time": datetime.now() + timedelta(minutes=self.position_hold_time)
-                }
+                signal = TradeSignal(
+                    symbol=symbol,
+                    action="buy" if direction > 0 else "sell",
+                    size=position_size,
+                    stop_loss=stop_loss,
+                    take_profit=take_profit,
+                    reason=f"News reaction: {event_name}",
+                    entry_time=entry_time,
+                    exit_time=exit_time,
+                    importance=importance
+                )
                 
-                self.logger.info(f"Generated signal for {symbol}: {signal['action']}, size: {position_size}")
+                self.logger.info(f"Generated signal for {symbol}: {signal.action}, size: {position_size}")
                 
                 # Add to signals list for execution
-                self.event_queue.append({
-                    "type": "trade_signal",
-                    "timestamp": datetime.now(),
-                    "importance": 1.0,  # High importance for trade signals
-                    "signal": signal
-                })
+                with self.event_lock:
+                    heapq.heappush(self.signal_queue, (-importance, next(self._event_seq), signal))
+                    if len(self.signal_queue) > self.max_signal_queue:
+                        # Keep the most important signals; a sorted list is still a valid heap
+                        self.signal_queue = heapq.nsmallest(self.max_signal_queue, self.signal_queue)
                 
             except Exception as e:
                 self.logger.error(f"Error generating signal for {symbol}: {str(e)}")
@@ -464,46 +682,6 @@ class NewsImpactStrategy(EventStrategyBase):
                 
         return 0  # No trade
     
-    def _calculate_position_size(self, symbol: str, balance: float, risk_percent: float, price_data: Dict[str, Any]) -> float:
-        """
-        Calculate position size based on account balance and risk percentage.
-        
-        Args:
-            symbol: Trading symbol
-            balance: Account balance
-            risk_percent: Percentage of balance to risk
-            price_data: Current price data
-            
-        Returns:
-            float: Position size
-        """
-        # Calculate the dollar amount to risk
-        risk_amount = balance * (risk_percent / 100)
-        
-        # Calculate stop loss distance in pips
-        stop_loss_pips = self._calculate_stop_loss_pips(symbol, price_data)
-        
-        # Convert to position size
-        if stop_loss_pips > 0 and self.broker:
-            # Get symbol information
-            symbol_info = self.broker.get_symbol_info(symbol)
-            
-            if symbol_info:
-                # Calculate position size
-                pip_value = self.broker.get_pip_value(symbol)
-                
-                if pip_value > 0:
-                    position_size = risk_amount / (stop_loss_pips * pip_value)
-                    
-                    # Round to standard lot size
-                    lot_step = symbol_info.volume_step
-                    position_size = round(position_size / lot_step) * lot_step
-                    
-                    return position_size
-        
-        # Default to minimum position size
-        return 0.01  # Minimum 0.01 lots
-    
     def _calculate_stop_loss_pips(self, symbol: str, price_data: Dict[str, Any]) -> float:
         """
         Calculate stop loss distance in pips based on recent volatility.
@@ -515,8 +693,15 @@ class NewsImpactStrategy(EventStrategyBase):
         Returns:
             float: Stop loss distance in pips
         """
+        symbol_id = self.SYMBOL_ID[symbol]
+        
+        # Precomputed from the average volatility when market data was loaded
+        stop_pips = self._stop_pips[symbol_id]
+        if stop_pips > 0:
+            return stop_pips
+            
         # Use average volatility if available, otherwise use a fixed value
-        volatility = self.avg_volatility.get(symbol, 0)
+        volatility = self.avg_volatility[symbol_id]
         
         if volatility <= 0:
             # Fallback to high-low range from price data
@@ -537,123 +722,91 @@ class NewsImpactStrategy(EventStrategyBase):
         
         return adjusted_volatility * 10000  # Assuming 4-digit quotes
     
-    def _calculate_stop_loss(self, symbol: str, direction: int, price_data: Dict[str, Any]) -> float:
+    def generate_signals(self) -> List[TradeSignal]:
         """
-        Calculate stop loss price.
+        Generate trading signals based on the strategy logic.
         
-        Args:
-            symbol: Trading symbol
-            direction: Trade direction (1 for buy, -1 for sell)
-            price_data: Current price data
-            
         Returns:
-            float: Stop loss price
+            List[TradeSignal]: Queued trade signals, most important first
         """
-        stop_pips = self._calculate_stop_loss_pips(symbol, price_data)
+        # Turn news reactions that have played out into signals
+        self._run_deferred_analyses()
+        
+        # Take the trade signals queued by event reactions, holding the lock only for the swap
+        with self.event_lock:
+            queued, self.signal_queue = self.signal_queue, []
         
-        if direction > 0:  # Buy
-            return price_data["close"] - (stop_pips * self.broker.point if self.broker else stop_pips * 0.0001)
-        else:  # Sell
-            return price_data["close"] + (stop_pips * self.broker.point if self.broker else stop_pips * 0.0001)
+        return [heapq.heappop(queued)[2] for _ in range(len(queued))]
     
-    def _calculate_take_profit(self, symbol: str, direction: int, price_data: Dict[str, Any]) -> float:
+    def execute_signals(self, signals: List[TradeSignal]) -> List[Dict[str, Any]]:
         """
-        Calculate take profit price.
+        Execute the generated signals by placing orders with the broker.
         
         Args:
-            symbol: Trading symbol
-            direction: Trade direction (1 for buy, -1 for sell)
-            price_data: Current price data
+            signals: List of signals to execute
             
         Returns:
-            float: Take profit price
-        """
-        stop_pips = self._calculate_stop_loss_pips(symbol, price_data)
-        take_pips = stop_pips * self.target_profit_ratio
-        
-        if direction > 0:  # Buy
-            return price_data["close"] + (take_pips * self.broker.point if self.broker else take_pips * 0.0001)
-        else:  # Sell
-            return price_data["close"] - (take_pips * self.broker.point if self.broker else take_pips * 0.0001)
-    
-    def generate_signals(self) -> List[Dict[str, Any]]:
-        """
-        Generate trading signals based on the strategy logic.
-        
-        Returns:
-            List[Dict]: List of signal dictionaries
+            List[Dict]: Results of the execution attempts
         """
-        signals = []
-        
-        # Process any trade signals in the event queue
-        for event in list(self.event_queue):
-            if event.get("type") == "trade_signal":
-                signal = event.get("signal")
-                if signal:
-                    signals.append(signal)
-                    self.event_queue.remove(event)
+        if not self.broker:
+            return []
+            
+        # Place the orders concurrently in batches
+        results = self._dispatch_orders(signals, self._execute_signal)
         
-        return signals
+        return [result for result in results if result]
     
-    def execute_signals(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _execute_signal(self, signal: TradeSignal) -> Optional[Dict[str, Any]]:
         """
-        Execute the generated signals by placing orders with the broker.
+        Place the order for a single signal.
         
         Args:
-            signals: List of signals to execute
+            signal: Signal to execute
             
         Returns:
-            List[Dict]: Results of the execution attempts
+            Optional[Dict]: Execution result, or None if the order was not placed
         """
-        results = []
-        
-        if not self.broker:
-            return results
-            
-        for signal in signals:
-            try:
-                symbol = signal.get("symbol", "")
-                action = signal.get("action", "")
-                size = signal.get("size", 0)
-                stop_loss = signal.get("stop_loss", 0)
-                take_profit = signal.get("take_profit", 0)
+        try:
+            symbol = signal.symbol
+            action = signal.action
+            size = signal.size
+            stop_loss = signal.stop_loss
+            take_profit = signal.take_profit
+            
+            # Check for valid parameters
+            if not symbol or not action or size <= 0:
+                return None
                 
-                # Check for valid parameters
-                if not symbol or not action or size <= 0:
-                    continue
-                    
-                # Execute the trade
-                result = None
-                if action == "buy":
-                    result = self.broker.open_buy_position(symbol, size, stop_loss, take_profit)
-                elif action == "sell":
-                    result = self.broker.open_sell_position(symbol, size, stop_loss, take_profit)
-                    
-                if result and result.get("ticket", 0) > 0:
-                    self.logger.info(f"Executed {action} order for {symbol}, size: {size}, ticket: {result['ticket']}")
-                    
-                    # Add execution result
-                    execution_result = {
-                        "symbol": symbol,
-                        "action": action,
-                        "size": size,
-                        "price": result.get("price", 0),
-                        "ticket": result.get("ticket", 0),
-                        "time": datetime.now(),
-                        "type": "new_position",
-                        "stop_loss": stop_loss,
-                        "take_profit": take_profit,
-                        "reason": signal.get("reason", "")
-                    }
-                    
-                    results.append(execution_result)
-                else:
-                    self.logger.error(f"Failed to execute {action} order for {symbol}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error executing signal: {str(e)}")
+            # Execute the trade
+            result = None
+            if action == "buy":
+                result = self.broker.open_buy_position(symbol, size, stop_loss, take_profit)
+            elif action == "sell":
+                result = self.broker.open_sell_position(symbol, size, stop_loss, take_profit)
                 
-        return results
+            if result and result.get("ticket", 0) > 0:
+                self.logger.info(f"Executed {action} order for {symbol}, size: {size}, ticket: {result['ticket']}")
+                
+                # Return execution result
+                return {
+                    "symbol": symbol,
+                    "action": action,
+                    "size": size,
+                    "price": result.get("price", 0),
+                    "ticket": result.get("ticket", 0),
+                    "time": datetime.now(),
+                    "type": "new_position",
+                    "stop_loss": stop_loss,
+                    "take_profit": take_profit,
+                    "reason": signal.reason
+                }
+                
+            self.logger.error(f"Failed to execute {action} order for {symbol}")
+            
+        except Exception as e:
+            self.logger.error(f"Error executing signal: {str(e)}")
+            
+        return None
     
     def manage_positions(self) -> List[Dict[str, Any]]:
         """
@@ -670,14 +823,17 @@ class NewsImpactStrategy(EventStrategyBase):
         # Get all open positions
         open_positions = self.broker.get_open_positions()
         
+        # One clock reading for the whole pass
+        now = datetime.now()
+        
         for position in open_positions:
             try:
                 symbol = position.get("symbol", "")
                 ticket = position.get("ticket", 0)
-                open_time = position.get("time", datetime.now())
+                open_time = position.get("time", now)
                 
                 # Check if the position has been open long enough
-                position_age = (datetime.now() - open_time).total_seconds() / 60  # minutes
+                position_age = (now - open_time).total_seconds() / 60  # minutes
                 
                 # If position has been open longer than the hold time, close it
                 if position_age >= self.position_hold_time:
@@ -692,7 +848,7 @@ class NewsImpactStrategy(EventStrategyBase):
                             "ticket": ticket,
                             "action": "close",
                             "profit": result.get("profit", 0),
-                            "time": datetime.now(),
+                            "time": now,
                             "type": "close_position",
                             "reason": f"Position hold time ({self.position_hold_time} min) elapsed"
                         }
@@ -704,7 +860,7 @@ class NewsImpactStrategy(EventStrategyBase):
                 
         return results
     
-    def manage_risk(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def manage_risk(self, signals: List[TradeSignal]) -> List[TradeSignal]:
         """
         Apply risk management rules to the signals before execution.
         
@@ -712,45 +868,37 @@ class NewsImpactStrategy(EventStrategyBase):
             signals: List of signals to risk-manage
             
         Returns:
-            List[Dict]: Risk-adjusted signals
+            List[TradeSignal]: Risk-adjusted signals
         """
         # First, check if any high-impact news is imminent
-        imminent_news = False
-        
-        if not self.news_calendar.empty:
-            high_impact_soon = self.news_calendar[
-                (self.news_calendar["impact_value"] >= self.impact_threshold) & 
-                (self.news_calendar["time_until"] <= self.pre_news_buffer) &
-                (self.news_calendar["time_until"] > 0)
-            ]
-            
-            imminent_news = not high_impact_soon.empty
+        lo, hi = self._events_within(self._high_impact_epochs, self.pre_news_buffer * 60)
+        imminent_news = lo < hi
         
         # If high-impact news is imminent, don't take new positions
         if imminent_news:
             self.logger.info("High-impact news imminent. Not taking new positions.")
             return []
         
-        risk_adjusted_signals = []
-        
-        for signal in signals:
-            symbol = signal.get("symbol", "")
-            
-            # Skip symbols with excessive spread
-            if self.broker:
-                current_spread = self.broker.get_current_spread(symbol)
-                avg_spread = self.avg_spreads.get(symbol, 0)
-                
-                if avg_spread > 0 and current_spread > avg_spread * self.max_spread_factor:
-                    self.logger.info(f"Skipping {symbol} due to excessive spread: {current_spread} > {avg_spread * self.max_spread_factor}")
-                    continue
-            
-            # Apply position sizing
-            # (already done in generate_post_news_signals)
-            
-            risk_adjusted_signals.append(signal)
-        
-        return risk_adjusted_signals
+        # Position sizing is already done in _analyze_news_reaction
+        if not signals or not self.broker:
+            return list(signals)
+            
+        # Fetch the current spread of each signalled symbol once, concurrently
+        symbols = list(dict.fromkeys(signal.symbol for signal in signals))
+        current_spreads = np.fromiter(
+            self._data_pool.map(self.broker.get_current_spread, symbols), dtype=np.float64, count=len(symbols)
+        )
+        symbol_ids = np.fromiter((self.SYMBOL_ID.get(symbol, -1) for symbol in symbols), dtype=np.intp, count=len(symbols))
+        spread_limits = self.avg_spreads[symbol_ids] * self.max_spread_factor
+        
+        # Skip symbols with excessive spread
+        excessive = (spread_limits > 0) & (current_spreads > spread_limits)
+        skipped = set()
+        for i in np.flatnonzero(excessive):
+            skipped.add(symbols[i])
+            self.logger.info(f"Skipping {symbols[i]} due to excessive spread: {current_spreads[i]} > {spread_limits[i]}")
+            
+        return [signal for signal in signals if signal.symbol not in skipped]
     
     def _calculate_event_sentiment(self) -> float:
         """
@@ -759,38 +907,45 @@ class NewsImpactStrategy(EventStrategyBase):
         Returns:
             float: Sentiment score (-1.0 to 1.0)
         """
-        # Count recent high-impact events
-        positive_events = 0
-        negative_events = 0
-        total_weight = 0
+        # The score only changes when events are queued or processed
+        with self.event_lock:
+            version = self._queue_version
+            if self._sentiment_cache[0] == version:
+                return self._sentiment_cache[1]
+            events = self.event_queue
+            
+        score = self._score_event_sentiment(events)
+        self._sentiment_cache = (version, score)
+        return score
+    
+    def _score_event_sentiment(self, events: List[Dict[str, Any]]) -> float:
+        """
+        Score the sentiment of a set of events.
         
-        for event in self.event_queue:
-            event_type = event.get("type", "")
-            importance = event.get("importance", 0)
+        Args:
+            events: Events to score
             
-            if event_type == "economic_release" and importance > 0:
-                # Get forecast vs previous
-                forecast = event.get("forecast", "")
-                previous = event.get("previous", "")
-                
-                # Try to convert to numbers
-                try:
-                    forecast_val = self._extract_number(forecast)
-                    previous_val = self._extract_number(previous)
-                    
-                    if forecast_val is not None and previous_val is not None:
-                        if forecast_val > previous_val:
-                            positive_events += importance
-                        elif forecast_val < previous_val:
-                            negative_events += importance
-                        
-                        total_weight += importance
-                except:
-                    pass
+        Returns:
+            float: Sentiment score (-1.0 to 1.0)
+        """
+        releases = [event for event in events if event.get("type", "") == "economic_release"]
+        if not releases:
+            return 0.0
+            
+        # Forecast and previous figures were parsed when the calendar was loaded
+        count = len(releases)
+        importance = np.fromiter((event.get("importance", 0) for event in releases), dtype=np.float64, count=count)
+        forecast = np.fromiter((event.get("forecast_val", np.nan) for event in releases), dtype=np.float64, count=count)
+        previous = np.fromiter((event.get("previous_val", np.nan) for event in releases), dtype=np.float64, count=count)
+        
+        # Weight each comparable event by importance: +1 if the forecast beats the previous figure, -1 if below
+        comparable = (importance > 0) & ~np.isnan(forecast) & ~np.isnan(previous)
+        weights = importance[comparable]
+        total_weight = weights.sum()
         
         # Calculate sentiment score
         if total_weight > 0:
-            return (positive_events - negative_events) / total_weight
+            return float((np.sign(forecast[comparable] - previous[comparable]) * weights).sum() / total_weight)
         
         return 0.0
     
@@ -807,24 +962,14 @@ class NewsImpactStrategy(EventStrategyBase):
         if not isinstance(value_str, str):
             return None
             
-        # Remove non-numeric characters except for decimal point and minus sign
-        # But keep the % sign to check if it's a percentage
-        cleaned = value_str.replace(',', '')
+        # Ignore thousands separators and percent signs
+        cleaned = value_str.replace(',', '').replace('%', '')
         
-        # Check for percentage
-        is_percent = '%' in cleaned
-        if is_percent:
-            cleaned = cleaned.replace('%', '')
+        # Plain numbers such as "3.5" or "-0.2" convert directly
+        digits = cleaned[1:] if cleaned[:1] == '-' else cleaned
+        if digits[:1].isdecimal() and digits.replace('.', '', 1).isdecimal():
+            return float(cleaned)
             
-        # Find all numbers in the string
-        matches = re.findall(r'-?\d+\.?\d*', cleaned)
-        
-        if matches:
-            # Convert to float
-            try:
-                value = float(matches[0])
-                return value
-            except:
-                return None
-                
-        return None 
\ No newline at end of file
+        # Otherwise take the first number in the string
+        match = self._NUMBER_PATTERN.search(cleaned)
+        return float(match.group()) if match else None
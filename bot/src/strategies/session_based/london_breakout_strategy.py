@@ -6,22 +6,118 @@ This strategy trades the volatility breakout that often occurs at the start of t
 It identifies the price range during the pre-London hours and places orders to catch the breakout when London opens.
 """
 
+import heapq
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import pytz
-import pandas as pd
 import numpy as np
+from numba import njit
 
 from src.strategies.session_based.session_strategy_base import SessionStrategyBase
 from src.brokers.mt5_connector import MT5Connector
 from src.utils.logger import setup_logger
 
+@dataclass(slots=True)
+class PendingOrder:
+    """Breakout stop order waiting to be filled."""
+    symbol: str
+    type: str
+    price: float
+    size: float
+    sl: float
+    tp: float
+    placed_at: datetime
+    expiration: datetime
+
+@njit(cache=True)
+def _breakout_levels(
+    high: np.ndarray,
+    low: np.ndarray,
+    size: np.ndarray,
+    pip_value: np.ndarray,
+    lot_step: np.ndarray,
+    point: float,
+    risk_amount: float,
+    trigger: float,
+    stop_loss_factor: float,
+    take_profit_factor: float
+) -> np.ndarray:
+    """
+    Compute the breakout order levels and sizes for several symbols in one pass.
+    
+    Args:
+        high: Range high of each symbol
+        low: Range low of each symbol
+        size: Range size of each symbol
+        pip_value: Value of one pip per lot, 0 if unknown
+        lot_step: Volume step of each symbol
+        point: Price of one pip
+        risk_amount: Account currency to risk per order
+        trigger: Fraction of the range beyond it to enter at
+        stop_loss_factor: Stop loss distance as a multiple of the range
+        take_profit_factor: Take profit distance as a multiple of the range
+        
+    Returns:
+        Array with rows buy entry, sell entry, buy SL, buy TP, sell SL, sell TP,
+        buy size and sell size, one column per symbol; sizes are NaN when they
+        cannot be computed
+    """
+    n = len(high)
+    levels = np.empty((8, n))
+    
+    for i in range(n):
+        # Calculate entry points
+        buy_entry = high[i] + size[i] * trigger
+        sell_entry = low[i] - size[i] * trigger
+        
+        # Calculate stop loss and take profit levels
+        buy_sl = buy_entry - size[i] * stop_loss_factor
+        buy_tp = buy_entry + size[i] * take_profit_factor
+        sell_sl = sell_entry + size[i] * stop_loss_factor
+        sell_tp = sell_entry - size[i] * take_profit_factor
+        
+        # Default to minimum position size
+        buy_size = sell_size = 0.01
+        if pip_value[i] > 0:
+            # Cannot be sized with a zero point, lot step or stop distance
+            buy_size = sell_size = np.nan
+            step = lot_step[i]
+            if point != 0 and step != 0:
+                # Calculate pips at risk
+                buy_risk_pips = (buy_entry - buy_sl) / point
+                sell_risk_pips = (sell_sl - sell_entry) / point
+                
+                if buy_risk_pips != 0 and sell_risk_pips != 0:
+                    # Round to standard lot size
+                    buy_size = max(round(risk_amount / (buy_risk_pips * pip_value[i]) / step) * step, step)
+                    sell_size = max(round(risk_amount / (sell_risk_pips * pip_value[i]) / step) * step, step)
+                    
+        levels[0, i] = buy_entry
+        levels[1, i] = sell_entry
+        levels[2, i] = buy_sl
+        levels[3, i] = buy_tp
+        levels[4, i] = sell_sl
+        levels[5, i] = sell_tp
+        levels[6, i] = buy_size
+        levels[7, i] = sell_size
+        
+    return levels
+
 class LondonBreakoutStrategy(SessionStrategyBase):
     """
     A strategy that trades the volatility breakout at the start of the London session.
     """
     
+    __slots__ = (
+        "symbols", "range_hours", "breakout_trigger", "stop_loss_factor", "take_profit_factor",
+        "max_spread_pips", "max_trade_duration", "risk_per_trade", "_pip_multiplier",
+        "pending_orders", "open_trades", "_expiry_heap", "range_data", "_range_high", "_range_low",
+        "_range_size", "_symbol_meta", "broker", "mt5_config_path", "_data_pool"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the London breakout strategy.
@@ -42,17 +138,31 @@ class LondonBreakoutStrategy(SessionStrategyBase):
         self.stop_loss_factor = config.get("stop_loss_factor", 1.0)  # Multiple of range for stop loss
         self.take_profit_factor = config.get("take_profit_factor", 2.0)  # Multiple of range for take profit
         self.max_spread_pips = config.get("max_spread_pips", 1.5)  # Maximum spread in pips
+        
+        # Price of one spread pip per symbol, for the spread limit
+        self._pip_multiplier = {
+            symbol: 0.0001 if symbol.endswith("JPY") else 0.00001 for symbol in self.symbols
+        }
         self.max_trade_duration = config.get("max_trade_duration", 6)  # Hours to keep trade open
+        self.risk_per_trade = config.get("risk_per_trade", 1.0)  # Percentage of account to risk per trade
         
         # Trade management
         self.pending_orders = {}
-        self.open_trades = {}
+        self.open_trades = {}  # Open positions by ticket, refreshed each management pass
+        self._expiry_heap = []  # Heap of (time the position reaches max_trade_duration, ticket)
         self.range_data = {}
+        self._range_high = {}  # Range columns by symbol, mirroring range_data for the hot loops
+        self._range_low = {}
+        self._range_size = {}
+        self._symbol_meta = {}  # Symbol info, pip value and spread limit per symbol, for the current session
         
         # Broker connection
         self.broker = None
         self.mt5_config_path = config.get("mt5_config_path", "config/brokers/mt5_config.json")
         
+        # Worker threads for per-symbol broker data requests
+        self._data_pool = ThreadPoolExecutor(max_workers=config.get("data_workers", 8))
+        
     def initialize(self) -> bool:
         """
         Initialize the London breakout strategy.
@@ -74,6 +184,10 @@ class LondonBreakoutStrategy(SessionStrategyBase):
             self.logger.error(f"Error connecting to broker: {str(e)}")
             return False
             
+        # Compile the order level kernel now rather than at the London open
+        ones = np.ones(1)
+        _breakout_levels(ones, ones, ones, ones, ones, 1.0, 1.0, 1.0, 1.0, 1.0)
+        
         # Initialize parent
         return super().initialize()
         
@@ -93,6 +207,9 @@ class LondonBreakoutStrategy(SessionStrategyBase):
             # Calculate pre-session range for each symbol
             self._calculate_pre_london_ranges()
             
+            # Fetch the per-symbol broker data used to size the orders
+            self._load_symbol_meta()
+            
             # Place breakout orders
             self._place_breakout_orders()
     
@@ -110,6 +227,9 @@ class LondonBreakoutStrategy(SessionStrategyBase):
             # Cancel any pending orders
             self._cancel_pending_orders()
             
+            # Symbol metadata is reloaded at the next session start
+            self._symbol_meta.clear()
+            
         super()._on_session_end(session_name)
     
     def _calculate_pre_london_ranges(self) -> None:
@@ -117,18 +237,15 @@ class LondonBreakoutStrategy(SessionStrategyBase):
         now = datetime.now(pytz.UTC)
         london_session = self.SESSIONS["london"]
         
-        # Calculate the start of the range period
-        range_start = now.replace(
-            hour=london_session["start"].hour - self.range_hours,
+        # Calculate the start of the range period, which may fall on the previous day
+        day_offset, start_hour = divmod(london_session["start"].hour - self.range_hours, 24)
+        range_start = (now + timedelta(days=day_offset)).replace(
+            hour=start_hour,
             minute=0,
             second=0,
             microsecond=0
         )
         
-        if range_start.hour < 0:
-            # Handle case where range starts the previous day
-            range_start = range_start.replace(hour=range_start.hour + 24) - timedelta(days=1)
-        
         # Calculate the end of the range period (London open)
         range_end = now.replace(
             hour=london_session["start"].hour,
@@ -139,194 +256,272 @@ class LondonBreakoutStrategy(SessionStrategyBase):
         
         self.logger.info(f"Calculating pre-London range from {range_start.strftime('%H:%M')} to {range_end.strftime('%H:%M')} UTC")
         
-        # Get data for each symbol
-        for symbol in self.symbols:
-            try:
-                if not self.broker:
-                    continue
-                    
-                # Get historical data
-                timeframe = "M15"  # 15-minute timeframe
-                data = self.broker.get_historical_data(
-                    symbol, 
-                    timeframe, 
-                    int((range_end - range_start).total_seconds() / 60 / 15) + 5  # Add buffer
-                )
+        # Bar times are naive UTC
+        range_bounds = np.array(
+            [range_start.replace(tzinfo=None), range_end.replace(tzinfo=None)], dtype="datetime64[ns]"
+        )
+        
+        # M15 bars covering the range period, plus a buffer
+        bars_needed = int((range_end - range_start).total_seconds() // 900) + 5
+        
+        if not self.broker:
+            return
+            
+        # Get data for every symbol at once; the broker requests overlap on worker threads
+        futures = [
+            self._data_pool.submit(self._compute_range_for_symbol, symbol, range_bounds, bars_needed, now)
+            for symbol in self.symbols
+        ]
+        
+        for symbol, future in zip(self.symbols, futures):
+            range_info = future.result()
+            if range_info is not None:
+                self.range_data[symbol] = range_info
+                self._range_high[symbol] = range_info["high"]
+                self._range_low[symbol] = range_info["low"]
+                self._range_size[symbol] = range_info["size"]
+    
+    def _compute_range_for_symbol(
+        self,
+        symbol: str,
+        range_bounds: np.ndarray,
+        bars_needed: int,
+        now: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Calculate the pre-London price range of one symbol.
+        
+        Args:
+            symbol: Trading symbol
+            range_bounds: Start and end of the range period as naive UTC datetime64 values
+            bars_needed: Number of M15 bars to request
+            now: Time the range is calculated at
+            
+        Returns:
+            Optional[Dict]: Range data, or None if it could not be calculated
+        """
+        try:
+            # Get historical data
+            timeframe = "M15"  # 15-minute timeframe
+            data = self.broker.get_historical_data(symbol, timeframe, bars_needed)
+            
+            if data is None or data.empty:
+                self.logger.warning(f"No data available for {symbol}")
+                return None
                 
-                if data is None or data.empty:
-                    self.logger.warning(f"No data available for {symbol}")
-                    continue
+            # Bars come back in time order, so the range period is one contiguous slice
+            times = data['time'].to_numpy(dtype="datetime64[ns]")
+            first, last = np.searchsorted(times, range_bounds)
+            
+            if first >= last:
+                self.logger.warning(f"No data in range period for {symbol}")
+                return None
+            
+            # Calculate the high and low of the range
+            range_high = data['high'].to_numpy()[first:last].max()
+            range_low = data['low'].to_numpy()[first:last].min()
+            range_size = range_high - range_low
+            
+            self.logger.info(f"{symbol} range: High={range_high:.5f}, Low={range_low:.5f}, Size={range_size:.5f} pips")
+            
+            return {
+                "high": range_high,
+                "low": range_low,
+                "size": range_size,
+                "mid": (range_high + range_low) / 2,
+                "calculated_at": now
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error calculating range for {symbol}: {str(e)}")
+            return None
+    
+    def _load_symbol_meta(self) -> None:
+        """Fetch the per-symbol broker data used to size breakout orders, once per session."""
+        if not self.broker:
+            return
+            
+        def fetch(symbol: str) -> Optional[Dict[str, Any]]:
+            try:
+                symbol_info = self.broker.get_symbol_info(symbol)
+                if not symbol_info:
+                    return None
                     
-                # Filter data to the range period
-                data['datetime'] = pd.to_datetime(data['time'])
-                range_data = data[
-                    (data['datetime'] >= range_start) & 
-                    (data['datetime'] < range_end)
-                ]
-                
-                if range_data.empty:
-                    self.logger.warning(f"No data in range period for {symbol}")
-                    continue
-                
-                # Calculate the high and low of the range
-                range_high = range_data['high'].max()
-                range_low = range_data['low'].min()
-                range_size = range_high - range_low
-                
-                # Store the range data
-                self.range_data[symbol] = {
-                    "high": range_high,
-                    "low": range_low,
-                    "size": range_size,
-                    "mid": (range_high + range_low) / 2,
-                    "calculated_at": now
+                return {
+                    "info": symbol_info,
+                    "pip_value": self.broker.get_pip_value(symbol),
+                    "max_spread": self.max_spread_pips * self._pip_multiplier[symbol]
                 }
-                
-                self.logger.info(f"{symbol} range: High={range_high:.5f}, Low={range_low:.5f}, Size={range_size:.5f} pips")
-                
             except Exception as e:
-                self.logger.error(f"Error calculating range for {symbol}: {str(e)}")
+                self.logger.error(f"Error getting symbol info for {symbol}: {str(e)}")
+                return None
+                
+        for symbol, symbol_meta in zip(self.symbols, self._data_pool.map(fetch, self.symbols)):
+            if symbol_meta is not None:
+                self._symbol_meta[symbol] = symbol_meta
     
     def _place_breakout_orders(self) -> None:
         """Place breakout orders for symbols with valid range data."""
+        if not self.broker:
+            return
+            
+        # The balance is the same for every symbol
+        try:
+            balance = self.broker.get_account_info()["balance"]
+        except Exception as e:
+            self.logger.error(f"Error getting account info: {str(e)}")
+            return
+            
+        # Keep the symbols with a valid range, loaded symbol info and an acceptable spread
+        symbols = []
         for symbol, range_info in self.range_data.items():
             try:
-                if not self.broker:
-                    continue
-                    
                 # Check if range is valid
                 if range_info["size"] <= 0:
                     self.logger.warning(f"Invalid range size for {symbol}: {range_info['size']}")
                     continue
-                
-                # Get current price
-                current_price = self.broker.get_current_price(symbol)
-                if not current_price:
-                    self.logger.warning(f"Could not get current price for {symbol}")
-                    continue
                     
-                # Get symbol info for pip value and spread
-                symbol_info = self.broker.get_symbol_info(symbol)
-                if not symbol_info:
+                # Symbol info, pip value and spread limit, loaded at session start
+                symbol_meta = self._symbol_meta.get(symbol)
+                if symbol_meta is None:
                     self.logger.warning(f"Could not get symbol info for {symbol}")
                     continue
                     
                 # Check if spread is acceptable
-                current_spread = symbol_info.spread * self.broker.point
-                max_spread = self.max_spread_pips * (0.0001 if symbol.endswith("JPY") else 0.00001)
+                current_spread = symbol_meta["info"].spread * self.broker.point
+                max_spread = symbol_meta["max_spread"]
                 
                 if current_spread > max_spread:
                     self.logger.warning(f"Spread too high for {symbol}: {current_spread:.5f} > {max_spread:.5f}")
                     continue
+                    
+                symbols.append(symbol)
                 
-                # Calculate entry points
-                buy_entry = range_info["high"] + (range_info["size"] * self.breakout_trigger)
-                sell_entry = range_info["low"] - (range_info["size"] * self.breakout_trigger)
-                
-                # Calculate stop loss and take profit levels
-                buy_sl = buy_entry - (range_info["size"] * self.stop_loss_factor)
-                buy_tp = buy_entry + (range_info["size"] * self.take_profit_factor)
-                
-                sell_sl = sell_entry + (range_info["size"] * self.stop_loss_factor)
-                sell_tp = sell_entry - (range_info["size"] * self.take_profit_factor)
-                
-                # Calculate position size
-                account_info = self.broker.get_account_info()
-                risk_amount = account_info["balance"] * (self.risk_per_trade / 100)
-                
-                # Calculate pips at risk
-                buy_risk_pips = (buy_entry - buy_sl) / self.broker.point
-                sell_risk_pips = (sell_sl - sell_entry) / self.broker.point
-                
-                # Calculate position size
-                pip_value = self.broker.get_pip_value(symbol)
+            except Exception as e:
+                self.logger.error(f"Error placing breakout orders for {symbol}: {str(e)}")
                 
-                if pip_value > 0:
-                    buy_size = risk_amount / (buy_risk_pips * pip_value)
-                    sell_size = risk_amount / (sell_risk_pips * pip_value)
-                    
-                    # Round to standard lot size
-                    lot_step = symbol_info.volume_step
-                    buy_size = max(round(buy_size / lot_step) * lot_step, lot_step)
-                    sell_size = max(round(sell_size / lot_step) * lot_step, lot_step)
-                else:
-                    # Default to minimum position size
-                    buy_size = sell_size = 0.01
+        if not symbols:
+            return
+            
+        # Entry, stop loss and take profit levels and sizes for every symbol at once
+        levels = _breakout_levels(
+            np.array([self._range_high[symbol] for symbol in symbols], dtype=np.float64),
+            np.array([self._range_low[symbol] for symbol in symbols], dtype=np.float64),
+            np.array([self._range_size[symbol] for symbol in symbols], dtype=np.float64),
+            np.array([self._symbol_meta[symbol]["pip_value"] for symbol in symbols], dtype=np.float64),
+            np.array([self._symbol_meta[symbol]["info"].volume_step for symbol in symbols], dtype=np.float64),
+            self.broker.point,
+            balance * (self.risk_per_trade / 100),
+            self.breakout_trigger,
+            self.stop_loss_factor,
+            self.take_profit_factor
+        )
+        
+        # Orders placed in this pass share one placement time and expiration
+        now = datetime.now()
+        expiration = now + timedelta(hours=self.max_trade_duration)
+        
+        # Each symbol's orders are placed on its own worker thread
+        futures = [
+            self._order_pool.submit(self._place_symbol_breakout, symbol, levels[:, i].tolist(), now, expiration)
+            for i, symbol in enumerate(symbols)
+        ]
+        
+        for future in futures:
+            self.pending_orders.update(future.result())
+    
+    def _place_symbol_breakout(
+        self,
+        symbol: str,
+        levels: List[float],
+        placed_at: datetime,
+        expiration: datetime
+    ) -> Dict[int, PendingOrder]:
+        """
+        Place the buy stop and sell stop breakout orders for one symbol.
+        
+        Args:
+            symbol: Trading symbol
+            levels: Order levels and sizes for the symbol, as computed by _breakout_levels
+            placed_at: Time the orders are placed
+            expiration: Time the orders expire
+            
+        Returns:
+            Dict[int, PendingOrder]: Placed pending orders by ticket
+        """
+        placed = {}
+        buy_entry, sell_entry, buy_sl, buy_tp, sell_sl, sell_tp, buy_size, sell_size = levels
+        
+        try:
+            if not (np.isfinite(buy_size) and np.isfinite(sell_size)):
+                self.logger.warning(f"Could not size breakout orders for {symbol}")
+                return placed
                 
-                # Place pending orders
-                expiration = datetime.now() + timedelta(hours=self.max_trade_duration)
+            # Get current price
+            current_price = self.broker.get_current_price(symbol)
+            if not current_price:
+                self.logger.warning(f"Could not get current price for {symbol}")
+                return placed
                 
-                # Buy stop order
-                buy_ticket = self.broker.place_pending_order(
-                    symbol, 
-                    "buy_stop", 
-                    buy_size, 
-                    buy_entry, 
-                    buy_sl, 
-                    buy_tp, 
-                    expiration
+            # Send the buy stop and sell stop orders together
+            buy_ticket, sell_ticket = self.broker.place_pending_orders_batch([
+                (symbol, "buy_stop", buy_size, buy_entry, buy_sl, buy_tp, expiration),
+                (symbol, "sell_stop", sell_size, sell_entry, sell_sl, sell_tp, expiration)
+            ])
+            
+            # Store pending orders
+            if buy_ticket:
+                placed[buy_ticket] = PendingOrder(
+                    symbol=symbol,
+                    type="buy_stop",
+                    price=buy_entry,
+                    size=buy_size,
+                    sl=buy_sl,
+                    tp=buy_tp,
+                    placed_at=placed_at,
+                    expiration=expiration
                 )
                 
-                # Sell stop order
-                sell_ticket = self.broker.place_pending_order(
-                    symbol, 
-                    "sell_stop", 
-                    sell_size, 
-                    sell_entry, 
-                    sell_sl, 
-                    sell_tp, 
-                    expiration
+                self.logger.info(f"Placed buy stop order for {symbol} at {buy_entry:.5f}, size: {buy_size}, SL: {buy_sl:.5f}, TP: {buy_tp:.5f}")
+            
+            if sell_ticket:
+                placed[sell_ticket] = PendingOrder(
+                    symbol=symbol,
+                    type="sell_stop",
+                    price=sell_entry,
+                    size=sell_size,
+                    sl=sell_sl,
+                    tp=sell_tp,
+                    placed_at=placed_at,
+                    expiration=expiration
                 )
                 
-                # Store pending orders
-                if buy_ticket:
-                    self.pending_orders[buy_ticket] = {
-                        "symbol": symbol,
-                        "type": "buy_stop",
-                        "price": buy_entry,
-                        "size": buy_size,
-                        "sl": buy_sl,
-                        "tp": buy_tp,
-                        "placed_at": datetime.now(),
-                        "expiration": expiration
-                    }
-                    
-                    self.logger.info(f"Placed buy stop order for {symbol} at {buy_entry:.5f}, size: {buy_size}, SL: {buy_sl:.5f}, TP: {buy_tp:.5f}")
-                
-                if sell_ticket:
-                    self.pending_orders[sell_ticket] = {
-                        "symbol": symbol,
-                        "type": "sell_stop",
-                        "price": sell_entry,
-                        "size": sell_size,
-                        "sl": sell_sl,
-                        "tp": sell_tp,
-                        "placed_at": datetime.now(),
-                        "expiration": expiration
-                    }
-                    
-                    self.logger.info(f"Placed sell stop order for {symbol} at {sell_entry:.5f}, size: {sell_size}, SL: {sell_sl:.5f}, TP: {sell_tp:.5f}")
-                
-            except Exception as e:
-                self.logger.error(f"Error placing breakout orders for {symbol}: {str(e)}")
+                self.logger.info(f"Placed sell stop order for {symbol} at {sell_entry:.5f}, size: {sell_size}, SL: {sell_sl:.5f}, TP: {sell_tp:.5f}")
+            
+        except Exception as e:
+            self.logger.error(f"Error placing breakout orders for {symbol}: {str(e)}")
+        
+        return placed
     
     def _cancel_pending_orders(self) -> None:
         """Cancel all pending breakout orders."""
         if not self.broker:
             return
             
-        for ticket, order_info in list(self.pending_orders.items()):
-            try:
-                result = self.broker.cancel_order(ticket)
-                
-                if result:
-                    self.logger.info(f"Cancelled pending order {ticket} for {order_info['symbol']}")
-                    del self.pending_orders[ticket]
-                else:
-                    self.logger.warning(f"Failed to cancel pending order {ticket}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error cancelling order {ticket}: {str(e)}")
+        # Cancel every order in one concurrent batch rather than one round-trip each
+        tickets = list(self.pending_orders)
+        try:
+            results = self.broker.cancel_orders_batch(tickets)
+        except Exception as e:
+            self.logger.error(f"Error cancelling pending orders: {str(e)}")
+            return
+            
+        for ticket, result in zip(tickets, results):
+            if result:
+                self.logger.info(f"Cancelled pending order {ticket} for {self.pending_orders[ticket].symbol}")
+                del self.pending_orders[ticket]
+            else:
+                self.logger.warning(f"Failed to cancel pending order {ticket}")
     
     def generate_signals(self) -> List[Dict[str, Any]]:
         """
@@ -365,43 +560,71 @@ class LondonBreakoutStrategy(SessionStrategyBase):
         if not self.broker:
             return results
             
-        # Get all open positions
-        open_positions = self.broker.get_open_positions()
+        now = datetime.now()
+        max_age = timedelta(hours=self.max_trade_duration)
         
-        for position in open_positions:
+        # Get all open positions, and start tracking those opened since the last pass
+        open_positions = {position.get("ticket", 0): position for position in self.broker.get_open_positions()}
+        
+        for ticket, position in open_positions.items():
+            if ticket not in self.open_trades:
+                heapq.heappush(self._expiry_heap, (position.get("time", now) + max_age, ticket))
+            self.open_trades[ticket] = position
+            
+        # Forget positions that were closed elsewhere; their heap entries are skipped when popped
+        for ticket in self.open_trades.keys() - open_positions.keys():
+            del self.open_trades[ticket]
+            
+        # Close positions that have been open longer than the max duration, oldest first
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expired.append(heapq.heappop(self._expiry_heap))
+            
+        for expires_at, ticket in expired:
+            position = self.open_trades.get(ticket)
+            if position is None:
+                continue
+                
             try:
                 symbol = position.get("symbol", "")
-                ticket = position.get("ticket", 0)
-                open_time = position.get("time", datetime.now())
                 current_profit = position.get("profit", 0)
+                position_age = (now - position.get("time", now)).total_seconds() / 3600  # hours
                 
-                # Check if the position has been open for too long
-                position_age = (datetime.now() - open_time).total_seconds() / 3600  # hours
+                result = self.broker.close_position(ticket)
                 
-                # If position has been open longer than the max duration, close it
-                if position_age >= self.max_trade_duration:
-                    result = self.broker.close_position(ticket)
+                if result:
+                    self.logger.info(f"Closed position {ticket} after {position_age:.1f} hours, profit: {current_profit:.2f}")
+                    del self.open_trades[ticket]
                     
-                    if result:
-                        self.logger.info(f"Closed position {ticket} after {position_age:.1f} hours, profit: {current_profit:.2f}")
-                        
-                        # Add result
-                        close_result = {
-                            "symbol": symbol,
-                            "ticket": ticket,
-                            "action": "close",
-                            "profit": current_profit,
-                            "time": datetime.now(),
-                            "type": "close_position",
-                            "reason": f"Max trade duration ({self.max_trade_duration} hours) elapsed"
-                        }
-                        
-                        results.append(close_result)
-                
-                # Implement trailing stop if in profit
-                if current_profit > 0 and symbol in self.range_data:
-                    range_size = self.range_data[symbol]["size"]
+                    # Add result
+                    close_result = {
+                        "symbol": symbol,
+                        "ticket": ticket,
+                        "action": "close",
+                        "profit": current_profit,
+                        "time": now,
+                        "type": "close_position",
+                        "reason": f"Max trade duration ({self.max_trade_duration} hours) elapsed"
+                    }
                     
+                    results.append(close_result)
+                else:
+                    # Retry on the next pass
+                    heapq.heappush(self._expiry_heap, (expires_at, ticket))
+                    
+            except Exception as e:
+                heapq.heappush(self._expiry_heap, (expires_at, ticket))
+                self.logger.error(f"Error managing position: {str(e)}")
+                
+        # Implement trailing stop on the remaining positions in profit
+        range_sizes = self._range_size
+        for ticket, position in self.open_trades.items():
+            try:
+                symbol = position.get("symbol", "")
+                current_profit = position.get("profit", 0)
+                
+                range_size = range_sizes.get(symbol)
+                if current_profit > 0 and range_size is not None:
                     # If profit is at least 1x range size, move stop to breakeven
                     if current_profit >= range_size and position.get("sl", 0) != position.get("open_price", 0):
                         new_sl = position.get("open_price", 0)
@@ -417,7 +640,7 @@ class LondonBreakoutStrategy(SessionStrategyBase):
                                 "ticket": ticket,
                                 "action": "modify",
                                 "new_sl": new_sl,
-                                "time": datetime.now(),
+                                "time": now,
                                 "type": "modify_position",
                                 "reason": "Moved stop to breakeven"
                             }
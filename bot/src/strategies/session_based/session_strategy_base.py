@@ -5,40 +5,72 @@ These strategies focus on trading during specific market sessions (Asian, Europe
 and exploit patterns that emerge during those sessions.
 """
 
+from bisect import bisect_right
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
-from datetime import datetime, time, timedelta
-import pytz
+from datetime import datetime, time, timedelta, timezone
+from time import time as epoch_seconds
+from zoneinfo import ZoneInfo
 
 from src.strategies.base_strategy import BaseStrategy
-from src.utils.logger import setup_logger
+
+UTC = timezone.utc
+SECONDS_PER_DAY = 86400
+
+def _seconds_of_day(value: time) -> int:
+    """Whole seconds since midnight of a time of day."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+@dataclass(slots=True)
+class SessionStats:
+    """Trade statistics for one run of a market session."""
+    start_time: datetime
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    profit: float = 0.0
+    end_time: Optional[datetime] = None
+    duration: Optional[float] = None  # Hours, set when the session ends
 
 class SessionStrategyBase(BaseStrategy):
     """Base class for session-based trading strategies."""
     
+    __slots__ = (
+        "target_sessions", "timezone", "pre_session_prep_time", "post_session_eval_time",
+        "_boundary_keys", "_boundary_sessions", "_boundary_next",
+        "current_session", "session_start_time", "session_end_time", "in_active_session", "session_stats"
+    )
+    
     # Market session definitions (UTC times)
     SESSIONS = {
         "sydney": {
             "start": time(22, 0),  # 10 PM UTC
             "end": time(7, 0),     # 7 AM UTC
-            "timezone": pytz.timezone("Australia/Sydney")
+            "timezone": ZoneInfo("Australia/Sydney")
         },
         "tokyo": {
             "start": time(0, 0),   # 12 AM UTC
             "end": time(9, 0),     # 9 AM UTC
-            "timezone": pytz.timezone("Asia/Tokyo")
+            "timezone": ZoneInfo("Asia/Tokyo")
         },
         "london": {
             "start": time(8, 0),   # 8 AM UTC
             "end": time(16, 0),    # 4 PM UTC
-            "timezone": pytz.timezone("Europe/London")
+            "timezone": ZoneInfo("Europe/London")
         },
         "new_york": {
             "start": time(13, 0),  # 1 PM UTC
             "end": time(22, 0),    # 10 PM UTC
-            "timezone": pytz.timezone("America/New_York")
+            "timezone": ZoneInfo("America/New_York")
         }
     }
     
+    # (start, end, crosses midnight) of each session in seconds since midnight UTC
+    _SESSION_BOUNDS = {
+        name: (_seconds_of_day(session["start"]), _seconds_of_day(session["end"]), session["start"] >= session["end"])
+        for name, session in SESSIONS.items()
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the session-based strategy.
@@ -47,20 +79,22 @@ class SessionStrategyBase(BaseStrategy):
             config: Strategy configuration dictionary
         """
         super().__init__(config)
-        self.logger = setup_logger(f"{self.__class__.__name__}", f"logs/strategies/{self.__class__.__name__}.log")
         
         # Session-specific configuration
         self.target_sessions = config.get("target_sessions", ["london", "new_york"])
-        self.timezone = pytz.timezone(config.get("timezone", "UTC"))
+        self.timezone = ZoneInfo(config.get("timezone", "UTC"))
         self.pre_session_prep_time = config.get("pre_session_prep_time", 15)  # minutes
         self.post_session_eval_time = config.get("post_session_eval_time", 15)  # minutes
         
+        # The day split at every target session boundary, so session lookups are one bisect
+        self._build_session_table()
+        
         # Session state
         self.current_session = None
         self.session_start_time = None
         self.session_end_time = None
         self.in_active_session = False
-        self.session_stats = {}
+        self.session_stats = {}  # SessionStats of the latest run of each session, by name
         
     def initialize(self) -> bool:
         """
@@ -80,33 +114,102 @@ class SessionStrategyBase(BaseStrategy):
         self.logger.info(f"Trading sessions: {', '.join(self.target_sessions)}")
         return True
         
-    def is_session_active(self, session_name: str, current_time: Optional[datetime] = None) -> bool:
+    def _build_session_table(self) -> None:
+        """
+        Split the day at every target session start and end.
+        
+        The active session is the same throughout each part, and so is the next session
+        to start when none is active, so both are recorded per part.
+        """
+        known = [name for name in self.target_sessions if name in self._SESSION_BOUNDS]
+        self._boundary_keys = sorted({0, *(second for name in known for second in self._SESSION_BOUNDS[name][:2])})
+        self._boundary_sessions = []
+        self._boundary_next = []
+        
+        for boundary in self._boundary_keys:
+            current = next(
+                (name for name in self.target_sessions if self.is_session_active(name, now_s=boundary)),
+                None
+            )
+            self._boundary_sessions.append(current)
+            
+            # Next session to start; one starting this second is a day away
+            upcoming = None
+            if current is None and known:
+                until_start = [(self._SESSION_BOUNDS[name][0] - boundary) % SECONDS_PER_DAY or SECONDS_PER_DAY for name in known]
+                index = until_start.index(min(until_start))
+                upcoming = (known[index], self._SESSION_BOUNDS[known[index]][0])
+            self._boundary_next.append(upcoming)
+            
+    def _session_part(self, now_s: int) -> int:
+        """Index of the part of the day containing a number of seconds since midnight UTC."""
+        return bisect_right(self._boundary_keys, now_s) - 1
+        
+    @staticmethod
+    def _as_utc(current_time: datetime) -> datetime:
+        """
+        Convert a time to UTC, skipping the conversion for times already in UTC.
+        
+        Args:
+            current_time: Time to convert, naive times being taken as UTC
+            
+        Returns:
+            datetime: The time in UTC
+        """
+        if current_time.tzinfo is UTC:
+            return current_time
+            
+        if current_time.tzinfo is None:
+            return current_time.replace(tzinfo=UTC)
+            
+        return current_time.astimezone(UTC)
+        
+    @staticmethod
+    def _utc_seconds_of_day(current_time: Optional[datetime] = None) -> int:
+        """
+        Get the seconds since midnight UTC of a time.
+        
+        Args:
+            current_time: Time to convert, naive times being taken as UTC (defaults to now)
+            
+        Returns:
+            int: Whole seconds since midnight UTC
+        """
+        if current_time is None:
+            return int(epoch_seconds()) % SECONDS_PER_DAY
+            
+        return _seconds_of_day(SessionStrategyBase._as_utc(current_time).time())
+        
+    def is_session_active(
+        self,
+        session_name: str,
+        current_time: Optional[datetime] = None,
+        now_s: Optional[int] = None
+    ) -> bool:
         """
         Check if a specific market session is currently active.
         
         Args:
             session_name: Name of the session to check
             current_time: Current time (defaults to now)
+            now_s: Current seconds since midnight UTC, used instead of current_time when given
             
         Returns:
             bool: True if the session is active, False otherwise
         """
-        if session_name not in self.SESSIONS:
+        bounds = self._SESSION_BOUNDS.get(session_name)
+        if bounds is None:
             return False
             
-        if current_time is None:
-            current_time = datetime.now(pytz.UTC)
-        elif current_time.tzinfo is None:
-            current_time = pytz.UTC.localize(current_time)
+        if now_s is None:
+            now_s = self._utc_seconds_of_day(current_time)
             
-        session = self.SESSIONS[session_name]
-        current_utc_time = current_time.astimezone(pytz.UTC).time()
+        start, end, wraps = bounds
         
         # Handle sessions that cross midnight
-        if session["start"] < session["end"]:
-            return session["start"] <= current_utc_time < session["end"]
-        else:
-            return current_utc_time >= session["start"] or current_utc_time < session["end"]
+        if wraps:
+            return now_s >= start or now_s < end
+        return start <= now_s < end
             
     def get_current_session(self, current_time: Optional[datetime] = None) -> Optional[str]:
         """
@@ -118,14 +221,7 @@ class SessionStrategyBase(BaseStrategy):
         Returns:
             Optional[str]: Name of the active session, or None if no session is active
         """
-        if current_time is None:
-            current_time = datetime.now(pytz.UTC)
-            
-        for session_name in self.target_sessions:
-            if self.is_session_active(session_name, current_time):
-                return session_name
-                
-        return None
+        return self._boundary_sessions[self._session_part(self._utc_seconds_of_day(current_time))]
         
     def time_until_session(self, session_name: str, current_time: Optional[datetime] = None) -> Optional[timedelta]:
         """
@@ -142,22 +238,22 @@ class SessionStrategyBase(BaseStrategy):
             return None
             
         if current_time is None:
-            current_time = datetime.now(pytz.UTC)
+            current_time = datetime.now(UTC)
         elif current_time.tzinfo is None:
-            current_time = pytz.UTC.localize(current_time)
+            current_time = current_time.replace(tzinfo=UTC)
             
         session = self.SESSIONS[session_name]
         current_date = current_time.date()
-        current_utc_time = current_time.astimezone(pytz.UTC).time()
+        current_utc = self._as_utc(current_time)
         
         # Create datetime for session start today
-        session_start_today = datetime.combine(current_date, session["start"]).replace(tzinfo=pytz.UTC)
+        session_start_today = datetime.combine(current_date, session["start"], tzinfo=UTC)
         
         # If the session has already started today, calculate for tomorrow
-        if current_utc_time >= session["start"]:
+        if current_utc.time() >= session["start"]:
             session_start_today += timedelta(days=1)
             
-        time_diff = session_start_today - current_time.astimezone(pytz.UTC)
+        time_diff = session_start_today - current_utc
         return time_diff
         
     def analyze_market(self) -> Dict[str, Any]:
@@ -167,8 +263,10 @@ class SessionStrategyBase(BaseStrategy):
         Returns:
             Dict: Analysis results
         """
-        current_time = datetime.now(pytz.UTC)
-        current_session = self.get_current_session(current_time)
+        current_time = datetime.now(UTC)
+        now_s = _seconds_of_day(current_time.time())
+        part = self._session_part(now_s)
+        current_session = self._boundary_sessions[part]
         
         # Update session state
         if current_session != self.current_session:
@@ -183,21 +281,15 @@ class SessionStrategyBase(BaseStrategy):
             
         # Calculate next session if not in a session
         next_session_info = None
-        if current_session is None:
-            next_session = None
-            min_time_delta = timedelta(days=1)
+        upcoming = self._boundary_next[part]
+        if current_session is None and upcoming is not None:
+            next_session, start_s = upcoming
+            until_start = (start_s - now_s) % SECONDS_PER_DAY or SECONDS_PER_DAY
             
-            for session_name in self.target_sessions:
-                time_delta = self.time_until_session(session_name, current_time)
-                if time_delta and time_delta < min_time_delta:
-                    min_time_delta = time_delta
-                    next_session = session_name
-                    
-            if next_session:
-                next_session_info = {
-                    "name": next_session,
-                    "time_until": min_time_delta.total_seconds() / 60  # minutes
-                }
+            next_session_info = {
+                "name": next_session,
+                "time_until": (until_start - current_time.microsecond / 1e6) / 60  # minutes
+            }
             
         # Return analysis results
         return {
@@ -205,7 +297,7 @@ class SessionStrategyBase(BaseStrategy):
             "next_session": next_session_info,
             "in_active_session": current_session is not None,
             "current_time_utc": current_time,
-            "session_stats": self.session_stats.get(current_session, {})
+            "session_stats": self.session_stats.get(current_session)
         }
         
     def _on_session_start(self, session_name: str) -> None:
@@ -216,17 +308,11 @@ class SessionStrategyBase(BaseStrategy):
             session_name: Name of the session that is starting
         """
         self.logger.info(f"Session {session_name} started")
-        self.session_start_time = datetime.now(pytz.UTC)
+        self.session_start_time = datetime.now(UTC)
         self.in_active_session = True
         
         # Initialize session statistics
-        self.session_stats[session_name] = {
-            "trades": 0,
-            "wins": 0,
-            "losses": 0,
-            "profit": 0.0,
-            "start_time": self.session_start_time
-        }
+        self.session_stats[session_name] = SessionStats(start_time=self.session_start_time)
         
         # Perform session-specific initialization
         # This should be implemented by subclasses
@@ -240,15 +326,14 @@ class SessionStrategyBase(BaseStrategy):
             session_name: Name of the session that is ending
         """
         self.logger.info(f"Session {session_name} ended")
-        self.session_end_time = datetime.now(pytz.UTC)
+        self.session_end_time = datetime.now(UTC)
         self.in_active_session = False
         
         # Update session statistics
-        if session_name in self.session_stats:
-            self.session_stats[session_name]["end_time"] = self.session_end_time
-            self.session_stats[session_name]["duration"] = (
-                self.session_end_time - self.session_stats[session_name]["start_time"]
-            ).total_seconds() / 3600  # hours
+        stats = self.session_stats.get(session_name)
+        if stats is not None:
+            stats.end_time = self.session_end_time
+            stats.duration = (self.session_end_time - stats.start_time).total_seconds() / 3600  # hours
             
         # Perform session-specific cleanup
         # This should be implemented by subclasses
@@ -1,17 +1,37 @@
+import time
 from typing import Dict, Any, Optional
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
 from src.brokers.mt5_connector import MT5Connector
-from src.indicators.momentum.rsi import calculate_rsi, get_rsi_signal
+from src.indicators.momentum.rsi import (
+    calculate_rsi,
+    calculate_wilder_averages,
+    get_rsi_signal,
+    rsi_from_averages,
+    update_wilder_averages
+)
 from src.utils.logger import setup_logger
 
+# Bar lengths of the timeframes whose bars align with whole hours of server time
+BAR_SECONDS = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600
+}
+
 class RSIStrategy:
     """
     RSI-based trading strategy that buys when RSI is oversold and sells when RSI is overbought.
     """
     
+    __slots__ = (
+        "config", "symbol", "timeframe", "rsi_period", "overbought", "oversold", "risk_percent",
+        "_pip_value", "connector", "logger", "position", "last_signal", "_rsi_state"
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize RSI strategy with configuration."""
         self.config = config
@@ -21,6 +41,7 @@ class RSIStrategy:
         self.overbought = config.get('overbought', 70)
         self.oversold = config.get('oversold', 30)
         self.risk_percent = config.get('risk_percent', 1.0)
+        self._pip_value = 0.0001 if 'JPY' not in self.symbol else 0.01  # Price change of one pip
         
         # Initialize connector
         self.connector = MT5Connector(config['mt5_config_path'])
@@ -31,11 +52,16 @@ class RSIStrategy:
         # Strategy state
         self.position = None
         self.last_signal = None
+        self._rsi_state = None  # (epoch seconds, close, average gain, average loss) as of the last closed bar
     
     def start(self) -> bool:
         """Start the strategy."""
         try:
             self.logger.info(f"Starting RSI strategy for {self.symbol} on {self.timeframe}")
+            
+            # Compile the RSI kernel now rather than on the first iteration
+            calculate_rsi(np.zeros(self.rsi_period + 2), self.rsi_period)
+            
             return self.connector.connect()
         except Exception as e:
             self.logger.error(f"Failed to start strategy: {str(e)}")
@@ -49,12 +75,16 @@ class RSIStrategy:
         except Exception as e:
             self.logger.error(f"Error stopping strategy: {str(e)}")
     
-    def get_market_data(self) -> pd.DataFrame:
-        """Get recent market data for analysis."""
+    def get_market_data(self) -> Optional[np.ndarray]:
+        """Get recent market data for analysis, as the connector's array of bars."""
         try:
-            # Get data for period calculation plus some buffer
-            from_date = datetime.now() - timedelta(days=10)  # Adjust based on timeframe
-            data = self.connector.get_historical_data(
+            if self._rsi_state is not None:
+                # The RSI is carried forward, so only the bars since the last closed one are needed
+                from_date = datetime(1970, 1, 1) + timedelta(seconds=self._rsi_state[0])
+            else:
+                # Get data for period calculation plus some buffer
+                from_date = datetime.now() - timedelta(days=10)  # Adjust based on timeframe
+            data = self.connector.get_rates(
                 self.symbol, 
                 self.timeframe, 
                 from_date
@@ -62,25 +92,62 @@ class RSIStrategy:
             return data
         except Exception as e:
             self.logger.error(f"Error getting market data: {str(e)}")
-            return pd.DataFrame()
+            return None
     
-    def analyze_market(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def analyze_market(self, data: Optional[np.ndarray]) -> Dict[str, Any]:
         """Analyze market data and generate signals."""
-        if data.empty:
-            return {'signal': None, 'rsi': None}
+        if data is None or len(data) == 0:
+            return {'signal': None, 'rsi': None, 'close': None}
         
-        # Calculate RSI
-        rsi_values = calculate_rsi(data['close'].values, self.rsi_period)
-        current_rsi = rsi_values[-1]
+        current_rsi = self._update_rsi(data)
         
         # Generate signal
         signal = get_rsi_signal(current_rsi, self.overbought, self.oversold)
         
         return {
             'signal': signal,
-            'rsi': current_rsi
+            'rsi': current_rsi,
+            'close': float(data['close'][-1])
         }
     
+    def _update_rsi(self, data: np.ndarray) -> float:
+        """
+        Get the current RSI, carrying Wilder's averages forward between calls.
+        
+        The last bar is still forming, so the averages are kept as of the bar before it
+        and only advanced over bars that have closed since the previous call.
+        
+        Args:
+            data: Bars with epoch-second times, starting at the last closed bar once the RSI is warmed up
+            
+        Returns:
+            float: RSI at the latest close
+        """
+        period = self.rsi_period
+        times = data['time']
+        closes = np.ascontiguousarray(data['close'], dtype=np.float64)
+        state = self._rsi_state
+        
+        if state is None or times[0] != state[0] or len(closes) < 2:
+            # Warm up from the whole window
+            self._rsi_state = None
+            if len(closes) - 2 < period:
+                return calculate_rsi(closes, period)[-1]
+                
+            avg_gain, avg_loss = calculate_wilder_averages(closes[:-1], period)
+        else:
+            # Advance over the bars that closed since the last call
+            _, last_close, avg_gain, avg_loss = state
+            for close in closes[1:-1].tolist():
+                avg_gain, avg_loss = update_wilder_averages(avg_gain, avg_loss, close - last_close, period)
+                last_close = close
+                
+        self._rsi_state = (int(times[-2]), float(closes[-2]), avg_gain, avg_loss)
+        
+        # Include the forming bar without committing it
+        avg_gain, avg_loss = update_wilder_averages(avg_gain, avg_loss, closes[-1] - closes[-2], period)
+        return rsi_from_averages(avg_gain, avg_loss)
+    
     def calculate_position_size(self, account_balance: float, stop_loss_pips: int, current_price: float) -> float:
         """
         Calculate position size based on risk percentage.
@@ -97,8 +164,7 @@ class RSIStrategy:
         risk_amount = account_balance * (self.risk_percent / 100.0)
         
         # Convert pips to price
-        pip_value = 0.0001 if 'JPY' not in self.symbol else 0.01
-        stop_loss_amount = stop_loss_pips * pip_value
+        stop_loss_amount = stop_loss_pips * self._pip_value
         
         # Calculate position size (standard lots)
         position_size = risk_amount / (stop_loss_amount * 100000)
@@ -124,7 +190,7 @@ class RSIStrategy:
             account_info = self.connector.get_account_info()
             
             # Calculate position size based on risk percentage
-            price = self.get_market_data()['close'].iloc[-1]
+            price = analysis['close']
             stop_pips = 50  # Example stop loss in pips
             position_size = self.calculate_position_size(
                 account_balance=account_info['balance'],
@@ -133,7 +199,7 @@ class RSIStrategy:
             )
             
             # Calculate stop loss and take profit levels
-            pip_value = 0.0001 if 'JPY' not in self.symbol else 0.01
+            pip_value = self._pip_value
             stop_loss = price - (stop_pips * pip_value) if signal == "BUY" else price + (stop_pips * pip_value)
             take_profit = price + (stop_pips * pip_value * 2) if signal == "BUY" else price - (stop_pips * pip_value * 2)
             
@@ -148,31 +214,46 @@ class RSIStrategy:
             )
             
             self.last_signal = signal
-            self.logger.info(f"Executed {signal} order for {self.symbol}. RSI: {analysis['rsi']}, Size: {position_size}")
+            self.logger.info("Executed %s order for %s. RSI: %s, Size: %s", signal, self.symbol, analysis['rsi'], position_size)
             return order_id
             
         except Exception as e:
             self.logger.error(f"Error executing signal: {str(e)}")
             return None
     
+    def _seconds_until_next_bar(self) -> float:
+        """
+        Get how long to wait before the next iteration.
+        
+        Returns:
+            Seconds until just after the current bar closes, or 60 for timeframes whose
+            bar boundaries depend on the broker's server time zone
+        """
+        bar_seconds = BAR_SECONDS.get(self.timeframe)
+        if bar_seconds is None:
+            return 60
+            
+        # Wake a second after the close so the new bar is available
+        return max(1, bar_seconds - time.time() % bar_seconds + 1)
+    
     def run_iteration(self) -> None:
         """Run a single iteration of the strategy."""
         try:
             # Get market data
             data = self.get_market_data()
-            if data.empty:
+            if data is None:
                 self.logger.warning("No market data available")
                 return
             
             # Analyze market
             analysis = self.analyze_market(data)
-            self.logger.info(f"Market analysis: Symbol={self.symbol}, RSI={analysis['rsi']}, Signal={analysis['signal']}")
+            self.logger.info("Market analysis: Symbol=%s, RSI=%s, Signal=%s", self.symbol, analysis['rsi'], analysis['signal'])
             
             # Execute signal if available
             if analysis['signal']:
                 order_id = self.execute_signal(analysis)
                 if order_id:
-                    self.logger.info(f"Order executed with ID: {order_id}")
+                    self.logger.info("Order executed with ID: %s", order_id)
             
         except Exception as e:
             self.logger.error(f"Error in strategy iteration: {str(e)}")
@@ -201,9 +282,8 @@ class RSIStrategy:
                 if iterations is not None and count >= iterations:
                     running = False
                 
-                # Sleep between iterations (adjust as needed)
-                import time
-                time.sleep(60)  # 1 minute between checks
+                # Sleep until the next bar is available
+                time.sleep(self._seconds_until_next_bar())
                 
         except KeyboardInterrupt:
             self.logger.info("Strategy stopped by user")
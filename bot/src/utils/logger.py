@@ -1,9 +1,35 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional
 import sys
 
+# The log format has no thread or process fields, so skip collecting them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Output handlers shared by every logger writing to the same destination
+_destination_handlers: Dict[str, logging.Handler] = {}
+
+# Background threads that write the records queued by each logger
+_listeners: List[QueueListener] = []
+
+def _stop_listeners() -> None:
+    """Write out any queued records and stop the background log writers."""
+    for listener in _listeners:
+        listener.stop()
+
+atexit.register(_stop_listeners)
+
+@lru_cache(maxsize=None)
+def _ensure_dir(log_dir: str) -> None:
+    """Create a log directory, once per directory."""
+    os.makedirs(log_dir, exist_ok=True)
+
 def setup_logger(
     name: str, 
     log_file: Optional[str] = None, 
@@ -26,9 +52,13 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    # Create logger
+    # Create logger, reusing it as-is if it was already set up
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+        
     logger.setLevel(level)
+    logger.propagate = False  # Handlers are attached here; don't repeat records through the root logger
     
     # Create formatter
     formatter = logging.Formatter(
@@ -36,27 +66,45 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    handlers = []
+    
     # Add console handler if requested
     if console_output:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        console_handler = _destination_handlers.get("<stdout>")
+        if console_handler is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(formatter)
+            _destination_handlers["<stdout>"] = console_handler
+        handlers.append(console_handler)
     
     # Add file handler if log_file is provided
     if log_file:
-        # Create directory if it doesn't exist
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        
-        # Create rotating file handler
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=max_file_size_mb * 1024 * 1024,
-            backupCount=backup_count
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_key = os.path.abspath(log_file)
+        file_handler = _destination_handlers.get(file_key)
+        if file_handler is None:
+            # Create directory if it doesn't exist
+            log_dir = os.path.dirname(log_file)
+            if log_dir:
+                _ensure_dir(log_dir)
+            
+            # Create rotating file handler, opening the file on the first record
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=max_file_size_mb * 1024 * 1024,
+                backupCount=backup_count,
+                delay=True
+            )
+            file_handler.setFormatter(formatter)
+            _destination_handlers[file_key] = file_handler
+        handlers.append(file_handler)
+    
+    # Write on a background thread so logging calls only enqueue the record
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+        logger.addHandler(QueueHandler(log_queue))
     
     return logger
 